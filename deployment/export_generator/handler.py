@@ -11,15 +11,22 @@ Generates:
 Outputs uploaded to s3://crazygels-scraper-exports/
 """
 
-import csv
-import io
+import functools
 import json
 import logging
 import os
+import shutil
+import tempfile
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 import boto3
-import psycopg2
+import orjson
+import psycopg2.extras
+import psycopg2.pool
+from boto3.s3.transfer import TransferConfig
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -27,117 +34,216 @@ logger.setLevel(logging.INFO)
 DB_SECRET_ARN = os.environ["DB_SECRET_ARN"]
 EXPORT_BUCKET = os.environ["EXPORT_BUCKET"]
 
-_db_conn = None
+# Large reports are streamed to S3 in 8 MiB multipart chunks
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+)
+
+# Decode JSONB columns (efficacy/market signals) with orjson, not stdlib json
+psycopg2.extras.register_default_jsonb(globally=True, loads=orjson.loads)
+
+# Created once per container and reused across warm invocations
+_secretsmanager = boto3.client("secretsmanager")
+_s3 = boto3.client("s3")
+
+# One connection per export worker; psycopg2 connections are not
+# thread-safe, so the reports never share one.
+EXPORT_WORKERS = 4
+
+# TCP keepalives so idle warm-container connections survive NAT/RDS timeouts
+DB_KEEPALIVES = {
+    "keepalives": 1,
+    "keepalives_idle": 30,
+    "keepalives_interval": 10,
+    "keepalives_count": 3,
+}
+
+_db_pool = None
+# The export workers all ask for the pool at once on a cold container
+_db_pool_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=4)
+def _get_secret(secret_arn: str) -> dict:
+    """Fetch and decode a Secrets Manager secret (cached per container)."""
+    return json.loads(
+        _secretsmanager.get_secret_value(SecretId=secret_arn)["SecretString"]
+    )
 
 
-def get_db_connection():
-    global _db_conn
-    if _db_conn and not _db_conn.closed:
-        return _db_conn
+def get_db_pool() -> psycopg2.pool.ThreadedConnectionPool:
+    global _db_pool
+    if _db_pool and not _db_pool.closed:
+        return _db_pool
+
+    with _db_pool_lock:
+        # Another worker may have created it while this one waited
+        if _db_pool and not _db_pool.closed:
+            return _db_pool
+        secret = _get_secret(DB_SECRET_ARN)
+        _db_pool = psycopg2.pool.ThreadedConnectionPool(
+            1,
+            EXPORT_WORKERS,
+            host=secret["host"],
+            port=secret["port"],
+            dbname=secret["database"],
+            user=secret["username"],
+            password=secret["password"],
+            connect_timeout=10,
+            **DB_KEEPALIVES,
+        )
+        return _db_pool
 
-    sm = boto3.client("secretsmanager")
-    secret = json.loads(
-        sm.get_secret_value(SecretId=DB_SECRET_ARN)["SecretString"]
-    )
 
-    _db_conn = psycopg2.connect(
-        host=secret["host"],
-        port=secret["port"],
-        dbname=secret["database"],
-        user=secret["username"],
-        password=secret["password"],
-        connect_timeout=10,
-    )
-    return _db_conn
+def _is_alive(conn) -> bool:
+    """Cheap round trip to detect connections dropped while the container idled."""
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+        conn.rollback()
+        return True
+    except psycopg2.Error:
+        return False
 
 
 def export_data(event, context):
-    """Main handler: generate all weekly exports."""
+    """Main handler: generate all weekly exports concurrently."""
     logger.info(f"Export generator triggered: {json.dumps(event, default=str)[:200]}")
 
-    s3 = boto3.client("s3")
-    today = datetime.utcnow().strftime("%Y-%m-%d")
     week = datetime.utcnow().strftime("%Y-W%V")
 
-    results = {}
+    with ThreadPoolExecutor(max_workers=EXPORT_WORKERS) as ex:
+        futures = {
+            name: ex.submit(_run_export, label, export_fn, week)
+            for name, label, export_fn in _EXPORTS
+        }
+    results = {name: future.result() for name, future in futures.items()}
 
-    # 1. Weekly competitor intelligence (frontend-safe JSON)
-    try:
-        data = _generate_intelligence_report()
-        key = f"weekly/{week}/competitor_intelligence.json"
-        s3.put_object(
-            Bucket=EXPORT_BUCKET,
-            Key=key,
-            Body=json.dumps(data, indent=2, ensure_ascii=False, default=str).encode(),
-            ContentType="application/json",
-            ServerSideEncryption="aws:kms",
-        )
-        results["intelligence"] = {"key": key, "products": len(data.get("products", []))}
-        logger.info(f"Intelligence report: {len(data.get('products', []))} products -> {key}")
-    except Exception as e:
-        logger.error(f"Intelligence report failed: {e}", exc_info=True)
-        results["intelligence"] = {"error": str(e)}
+    return {"statusCode": 200, "exports": results}
 
-    # 2. Price trends CSV
-    try:
-        csv_data = _generate_price_trends_csv()
-        key = f"weekly/{week}/price_trends.csv"
-        s3.put_object(
-            Bucket=EXPORT_BUCKET,
-            Key=key,
-            Body=csv_data.encode("utf-8"),
-            ContentType="text/csv",
-            ServerSideEncryption="aws:kms",
-        )
-        results["price_trends"] = {"key": key}
-        logger.info(f"Price trends CSV -> {key}")
-    except Exception as e:
-        logger.error(f"Price trends failed: {e}", exc_info=True)
-        results["price_trends"] = {"error": str(e)}
 
-    # 3. Price alert summary
+def _run_export(label: str, export_fn, week: str) -> dict:
+    """Run one export on its own pooled connection; errors are reported, not raised."""
+    pool = None
+    conn = None
     try:
-        alerts = _generate_alert_summary()
-        key = f"weekly/{week}/price_alerts.json"
-        s3.put_object(
-            Bucket=EXPORT_BUCKET,
-            Key=key,
-            Body=json.dumps(alerts, indent=2, default=str).encode(),
-            ContentType="application/json",
-            ServerSideEncryption="aws:kms",
-        )
-        results["alerts"] = {"key": key, "count": len(alerts.get("alerts", []))}
-        logger.info(f"Alert summary: {len(alerts.get('alerts', []))} alerts -> {key}")
+        pool = get_db_pool()
+        conn = pool.getconn()
+        if not _is_alive(conn):
+            logger.info(f"{label}: stale DB connection, reconnecting")
+            pool.putconn(conn, close=True)
+            conn = None
+            conn = pool.getconn()
+        return export_fn(conn, week)
     except Exception as e:
-        logger.error(f"Alert summary failed: {e}", exc_info=True)
-        results["alerts"] = {"error": str(e)}
-
-    # 4. Acquisition leads report (internal only)
-    try:
-        leads = _generate_acquisition_report()
-        key = f"weekly/{week}/acquisition_leads.json"
-        s3.put_object(
-            Bucket=EXPORT_BUCKET,
-            Key=key,
-            Body=json.dumps(leads, indent=2, default=str).encode(),
-            ContentType="application/json",
-            ServerSideEncryption="aws:kms",
+        logger.error(f"{label} failed: {e}", exc_info=True)
+        return {"error": str(e)}
+    finally:
+        if conn is not None:
+            # End the read-only transaction before handing the connection back
+            try:
+                conn.rollback()
+                pool.putconn(conn)
+            except Exception:
+                pool.putconn(conn, close=True)
+
+
+# ── Exports ─────────────────────────────────────────────────────
+
+def _export_intelligence(conn, week: str) -> dict:
+    """1. Weekly competitor intelligence (frontend-safe JSON)."""
+    key = f"weekly/{week}/competitor_intelligence.json"
+    with tempfile.TemporaryFile() as report:
+        product_count = _generate_intelligence_report(conn, report)
+        report.seek(0)
+        _s3.upload_fileobj(
+            report,
+            EXPORT_BUCKET,
+            key,
+            ExtraArgs={
+                "ContentType": "application/json",
+                "ServerSideEncryption": "aws:kms",
+            },
+            Config=_TRANSFER_CONFIG,
         )
-        results["leads"] = {"key": key, "count": len(leads.get("leads", []))}
-        logger.info(f"Acquisition leads: {len(leads.get('leads', []))} -> {key}")
-    except Exception as e:
-        logger.error(f"Acquisition report failed: {e}", exc_info=True)
-        results["leads"] = {"error": str(e)}
+    logger.info(f"Intelligence report: {product_count} products -> {key}")
+    return {"key": key, "products": product_count}
+
+
+def _export_price_trends(conn, week: str) -> dict:
+    """2. Price trends CSV."""
+    key = f"weekly/{week}/price_trends.csv"
+    with tempfile.TemporaryFile() as csv_file:
+        _generate_price_trends_csv(conn, csv_file)
+        csv_file.seek(0)
+        _s3.upload_fileobj(
+            csv_file,
+            EXPORT_BUCKET,
+            key,
+            ExtraArgs={
+                "ContentType": "text/csv",
+                "ServerSideEncryption": "aws:kms",
+            },
+            Config=_TRANSFER_CONFIG,
+        )
+    logger.info(f"Price trends CSV -> {key}")
+    return {"key": key}
+
+
+def _export_alerts(conn, week: str) -> dict:
+    """3. Price alert summary."""
+    alerts = _generate_alert_summary(conn)
+    key = f"weekly/{week}/price_alerts.json"
+    _s3.put_object(
+        Bucket=EXPORT_BUCKET,
+        Key=key,
+        Body=orjson.dumps(alerts, option=orjson.OPT_INDENT_2, default=str),
+        ContentType="application/json",
+        ServerSideEncryption="aws:kms",
+    )
+    logger.info(f"Alert summary: {len(alerts.get('alerts', []))} alerts -> {key}")
+    return {"key": key, "count": len(alerts.get("alerts", []))}
+
+
+def _export_leads(conn, week: str) -> dict:
+    """4. Acquisition leads report (internal only)."""
+    leads = _generate_acquisition_report(conn)
+    key = f"weekly/{week}/acquisition_leads.json"
+    _s3.put_object(
+        Bucket=EXPORT_BUCKET,
+        Key=key,
+        Body=orjson.dumps(leads, option=orjson.OPT_INDENT_2, default=str),
+        ContentType="application/json",
+        ServerSideEncryption="aws:kms",
+    )
+    logger.info(f"Acquisition leads: {len(leads.get('leads', []))} -> {key}")
+    return {"key": key, "count": len(leads.get("leads", []))}
 
-    return {"statusCode": 200, "exports": results}
+
+# (result key, log label, export function)
+_EXPORTS = (
+    ("intelligence", "Intelligence report", _export_intelligence),
+    ("price_trends", "Price trends", _export_price_trends),
+    ("alerts", "Alert summary", _export_alerts),
+    ("leads", "Acquisition report", _export_leads),
+)
 
 
 # ── Report generators ───────────────────────────────────────────
 
-def _generate_intelligence_report() -> dict:
-    """Frontend-safe anonymised product intelligence."""
-    conn = get_db_connection()
-    cur = conn.cursor()
+def _generate_intelligence_report(conn, out) -> int:
+    """Frontend-safe anonymised product intelligence, streamed as JSON into `out`.
+
+    Rows are read through a server-side cursor and written as they arrive,
+    so the full product list is never held in memory. Returns the number
+    of products written.
+    """
+    # Rows arrive as dicts keyed by column name, already in the report's
+    # product shape, so each one is serialised as-is (orjson renders the
+    # timestamptz as ISO 8601).
+    cur = conn.cursor(name="intel_cur", cursor_factory=psycopg2.extras.RealDictCursor)
+    cur.itersize = 5000
 
     cur.execute(
         """SELECT product_hash, category, name_clean, brand_type, price_tier,
@@ -146,78 +252,67 @@ def _generate_intelligence_report() -> dict:
            WHERE last_updated >= NOW() - interval '7 days'
            ORDER BY last_updated DESC"""
     )
-    rows = cur.fetchall()
-    cur.close()
 
-    products = []
-    for row in rows:
-        products.append({
-            "product_hash": row[0],
-            "category": row[1],
-            "name_clean": row[2],
-            "brand_type": row[3],
-            "price_tier": row[4],
-            "efficacy_signals": row[5],
-            "market_signals": row[6],
-            "acquisition_lead": row[7],
-            "last_updated": row[8].isoformat() if row[8] else None,
-        })
+    categories = defaultdict(
+        lambda: {"count": 0, "brand_types": Counter(), "price_tiers": Counter()}
+    )
+    total = 0
+    with tempfile.TemporaryFile() as products_buf:
+        for product in cur:
+            products_buf.write(b",\n    " if total else b"\n    ")
+            products_buf.write(orjson.dumps(product, default=str))
+            total += 1
+
+            # Category breakdown
+            stats = categories[product["category"] or "unknown"]
+            stats["count"] += 1
+            stats["brand_types"][product["brand_type"] or "unknown"] += 1
+            stats["price_tiers"][product["price_tier"] or "unknown"] += 1
+        cur.close()
+
+        header = orjson.dumps(
+            {
+                "generated_at": datetime.utcnow().isoformat(),
+                "period": "weekly",
+                "total_products": total,
+                "categories": categories,
+            },
+            option=orjson.OPT_INDENT_2,
+        )
+        # Reopen the indented object (drop its closing "\n}") and append
+        # the streamed products array.
+        out.write(header[:-2])
+        out.write(b',\n  "products": [')
+        products_buf.seek(0)
+        shutil.copyfileobj(products_buf, out)
+        out.write(b"\n  ]\n}" if total else b"]\n}")
 
-    # Category breakdown
-    categories = {}
-    for p in products:
-        cat = p["category"] or "unknown"
-        if cat not in categories:
-            categories[cat] = {"count": 0, "brand_types": {}, "price_tiers": {}}
-        categories[cat]["count"] += 1
-        bt = p["brand_type"] or "unknown"
-        categories[cat]["brand_types"][bt] = categories[cat]["brand_types"].get(bt, 0) + 1
-        pt = p["price_tier"] or "unknown"
-        categories[cat]["price_tiers"][pt] = categories[cat]["price_tiers"].get(pt, 0) + 1
+    return total
 
-    return {
-        "generated_at": datetime.utcnow().isoformat(),
-        "period": "weekly",
-        "total_products": len(products),
-        "categories": categories,
-        "products": products,
-    }
 
+def _generate_price_trends_csv(conn, out) -> None:
+    """Price aggregate trends as CSV for analytics tools, written into `out`.
 
-def _generate_price_trends_csv() -> str:
-    """Price aggregate trends as CSV for analytics tools."""
-    conn = get_db_connection()
+    Postgres formats the CSV itself via COPY, so rows never pass through
+    Python one by one.
+    """
     cur = conn.cursor()
-
-    cur.execute(
-        """SELECT source, category,
-                  DATE(computed_at) as date,
-                  avg_price, min_price, max_price, product_count
-           FROM price_aggregates
-           WHERE computed_at >= NOW() - interval '30 days'
-           ORDER BY date DESC, source, category"""
+    cur.copy_expert(
+        """COPY (
+               SELECT source, category,
+                      DATE(computed_at) AS date,
+                      avg_price, min_price, max_price, product_count
+               FROM price_aggregates
+               WHERE computed_at >= NOW() - interval '30 days'
+               ORDER BY date DESC, source, category
+           ) TO STDOUT WITH (FORMAT csv, HEADER)""",
+        out,
     )
-    rows = cur.fetchall()
     cur.close()
 
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(["source", "category", "date", "avg_price", "min_price", "max_price", "product_count"])
-    for row in rows:
-        writer.writerow([
-            row[0], row[1], row[2].isoformat() if row[2] else "",
-            float(row[3]) if row[3] else "",
-            float(row[4]) if row[4] else "",
-            float(row[5]) if row[5] else "",
-            row[6],
-        ])
-
-    return output.getvalue()
-
 
-def _generate_alert_summary() -> dict:
+def _generate_alert_summary(conn) -> dict:
     """Price alerts from the past week for the purchasing team."""
-    conn = get_db_connection()
     cur = conn.cursor()
 
     cur.execute(
@@ -257,9 +352,8 @@ def _generate_alert_summary() -> dict:
     }
 
 
-def _generate_acquisition_report() -> dict:
+def _generate_acquisition_report(conn) -> dict:
     """Internal: top acquisition opportunities based on market signals."""
-    conn = get_db_connection()
     cur = conn.cursor()
 
     cur.execute(
@@ -1,10 +1,10 @@
 """Lambda handlers for data processing and export generation."""
 
-import csv
-import io
+import functools
 import json
 import logging
 import os
+import tempfile
 from datetime import datetime, timedelta
 
 import boto3
@@ -14,20 +14,81 @@ logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
 
-def _get_db_connection():
-    """Get database connection using Secrets Manager credentials."""
-    client = boto3.client("secretsmanager")
-    secret = json.loads(
-        client.get_secret_value(SecretId=os.environ["DB_SECRET_ARN"])["SecretString"]
+# Created during the init phase and reused across warm invocations
+_secretsmanager = boto3.client("secretsmanager")
+_s3 = boto3.client("s3")
+
+# TCP keepalives so idle warm-container connections survive NAT/RDS timeouts
+DB_KEEPALIVES = {
+    "keepalives": 1,
+    "keepalives_idle": 30,
+    "keepalives_interval": 10,
+    "keepalives_count": 3,
+}
+
+_db_conn = None
+
+
+@functools.lru_cache(maxsize=4)
+def _get_secret(secret_arn: str) -> dict:
+    """Fetch and decode a Secrets Manager secret (cached per container)."""
+    return json.loads(
+        _secretsmanager.get_secret_value(SecretId=secret_arn)["SecretString"]
     )
-    return psycopg2.connect(
+
+
+def _is_alive(conn) -> bool:
+    """Cheap round trip to detect connections dropped while the container idled."""
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+        conn.rollback()
+        return True
+    except psycopg2.Error:
+        return False
+
+
+def _get_db_connection():
+    """Get the container's database connection using Secrets Manager credentials."""
+    global _db_conn
+    if _db_conn and not _db_conn.closed:
+        if _is_alive(_db_conn):
+            return _db_conn
+        logger.info("Stale DB connection, reconnecting")
+        _db_conn.close()
+
+    secret = _get_secret(os.environ["DB_SECRET_ARN"])
+    _db_conn = psycopg2.connect(
         host=secret["host"],
         port=secret["port"],
         dbname=secret["database"],
         user=secret["username"],
         password=secret["password"],
         sslmode="require",
+        connect_timeout=10,
+        **DB_KEEPALIVES,
     )
+    return _db_conn
+
+
+def _end_transaction(conn) -> None:
+    """Roll back conn, dropping it if broken so the next call reconnects."""
+    global _db_conn
+    try:
+        conn.rollback()
+    except psycopg2.Error as e:
+        logger.warning(f"Dropping broken DB connection: {e}")
+        conn.close()
+        if _db_conn is conn:
+            _db_conn = None
+
+
+# Open the connection at import so the secret fetch and TLS handshake happen
+# in the (unbilled) init phase; handlers retry if this fails.
+try:
+    _get_db_connection()
+except Exception as e:
+    logger.warning(f"Deferred DB connection to first invocation: {e}")
 
 
 def process(event, context):
@@ -61,26 +122,30 @@ def process(event, context):
                     product_count = EXCLUDED.product_count
             """)
 
-            # 2. Detect significant price drops (>15%) for competitive alerts
+            # 2. Detect significant price drops (>15%) for competitive alerts.
+            #    LAG pairs each price with the product's previous one in a
+            #    single pass; the 48h window covers the prior daily scrape.
             cur.execute("""
+                WITH w AS (
+                    SELECT
+                        product_id,
+                        price,
+                        scraped_at,
+                        LAG(price) OVER (PARTITION BY product_id ORDER BY scraped_at) as prev_price
+                    FROM price_history
+                    WHERE scraped_at >= NOW() - INTERVAL '48 hours'
+                )
                 INSERT INTO price_alerts (product_id, old_price, new_price, change_pct, detected_at)
                 SELECT
-                    ph_new.product_id,
-                    ph_old.price as old_price,
-                    ph_new.price as new_price,
-                    ((ph_new.price - ph_old.price) / ph_old.price * 100) as change_pct,
+                    product_id,
+                    prev_price as old_price,
+                    price as new_price,
+                    ((price - prev_price) / prev_price * 100) as change_pct,
                     NOW()
-                FROM price_history ph_new
-                JOIN LATERAL (
-                    SELECT price
-                    FROM price_history ph2
-                    WHERE ph2.product_id = ph_new.product_id
-                      AND ph2.scraped_at < ph_new.scraped_at
-                    ORDER BY ph2.scraped_at DESC
-                    LIMIT 1
-                ) ph_old ON TRUE
-                WHERE ph_new.scraped_at >= NOW() - INTERVAL '24 hours'
-                  AND ABS((ph_new.price - ph_old.price) / NULLIF(ph_old.price, 0) * 100) > 15
+                FROM w
+                WHERE scraped_at >= NOW() - INTERVAL '24 hours'
+                  AND prev_price IS NOT NULL
+                  AND ABS((price - prev_price) / NULLIF(prev_price, 0) * 100) > 15
             """)
 
             # 3. Flag out-of-stock competitor products (opportunity for Crazy Gels)
@@ -102,58 +167,53 @@ def process(event, context):
 
             return {"statusCode": 200, "body": "Processing complete"}
     except Exception as e:
-        conn.rollback()
+        _end_transaction(conn)
         logger.error(f"Processing failed: {e}")
         raise
-    finally:
-        conn.close()
 
 
 def export_data(event, context):
     """Weekly export: generate CSV reports and upload to S3."""
     logger.info("Starting weekly export generation")
     conn = _get_db_connection()
-    s3 = boto3.client("s3")
+    s3 = _s3
     bucket = os.environ["EXPORT_BUCKET"]
 
     try:
         with conn.cursor() as cur:
             today = datetime.utcnow().strftime("%Y-%m-%d")
 
-            # 1. Price comparison report
-            cur.execute("""
-                SELECT
-                    p.source, p.name, p.brand, p.category, p.url,
-                    ph.price, ph.currency, ph.sale_price, ph.in_stock,
-                    p.rating, p.review_count
-                FROM products p
-                JOIN LATERAL (
-                    SELECT * FROM price_history ph2
-                    WHERE ph2.product_id = p.id
-                    ORDER BY ph2.scraped_at DESC LIMIT 1
-                ) ph ON TRUE
-                ORDER BY p.category, p.source, ph.price
-            """)
-            rows = cur.fetchall()
-            columns = [
-                "source", "name", "brand", "category", "url",
-                "price", "currency", "sale_price", "in_stock",
-                "rating", "review_count",
-            ]
-
-            output = io.StringIO()
-            writer = csv.writer(output)
-            writer.writerow(columns)
-            for row in rows:
-                writer.writerow(row)
-
-            s3.put_object(
-                Bucket=bucket,
-                Key=f"reports/{today}/price-comparison.csv",
-                Body=output.getvalue().encode("utf-8"),
-                ContentType="text/csv",
-            )
-            logger.info(f"Exported {len(rows)} rows to price-comparison.csv")
+            # 1. Price comparison report, formatted as CSV by Postgres and
+            #    spooled to a temp file instead of being held in memory
+            with tempfile.TemporaryFile() as report:
+                cur.copy_expert("""
+                    COPY (
+                        SELECT
+                            p.source, p.name, p.brand, p.category, p.url,
+                            ph.price, ph.currency, ph.sale_price, ph.in_stock,
+                            p.rating, p.review_count
+                        FROM products p
+                        JOIN LATERAL (
+                            SELECT * FROM price_history ph2
+                            WHERE ph2.product_id = p.id
+                              -- Lower bound so only the newest partitions
+                              -- are probed; older products drop out
+                              AND ph2.scraped_at >= NOW() - INTERVAL '7 days'
+                            ORDER BY ph2.scraped_at DESC LIMIT 1
+                        ) ph ON TRUE
+                        ORDER BY p.category, p.source, ph.price
+                    ) TO STDOUT WITH (FORMAT csv, HEADER)
+                """, report)
+                row_count = cur.rowcount
+
+                report.seek(0)
+                s3.upload_fileobj(
+                    report,
+                    bucket,
+                    f"reports/{today}/price-comparison.csv",
+                    ExtraArgs={"ContentType": "text/csv"},
+                )
+            logger.info(f"Exported {row_count} rows to price-comparison.csv")
 
             # 2. Category averages JSON
             cur.execute("""
@@ -179,9 +239,10 @@ def export_data(event, context):
                 ContentType="application/json",
             )
 
-            return {"statusCode": 200, "body": f"Exported {len(rows)} products"}
+            return {"statusCode": 200, "body": f"Exported {row_count} products"}
     except Exception as e:
         logger.error(f"Export failed: {e}")
         raise
     finally:
-        conn.close()
+        # Keep the connection for the next invocation; just end the read
+        _end_transaction(conn)
@@ -4,15 +4,17 @@ Runs on schedule (daily) or on-demand via API Gateway.
 
 Promotes anonymised_products -> product_catalog by:
   1. Finding anonymised products not yet in product_catalog
-  2. Deriving product_type, efficacy_score, review_signals, suitable_for
+  2. Deriving product_type, efficacy_score, review_signals, suitable_for (in SQL)
   3. Inserting into product_catalog with status='research'
   4. Creating source_intelligence stubs with acquisition_lead linkage
-  5. Updating existing catalog entries with latest efficacy data
+  5. Updating existing catalog entries with latest efficacy data and
+     review signal trends
 
 Environment:
   DB_SECRET_ARN  - Secrets Manager ARN for RDS credentials
 """
 
+import functools
 import hashlib
 import json
 import logging
@@ -20,8 +22,8 @@ import os
 import re
 from datetime import datetime, timedelta
 
-import boto3
 import psycopg2
+from botocore.session import get_session
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -78,17 +80,73 @@ CATEGORY_TYPE_MAP = {
     "fragrances": "fragrance",
 }
 
+# suitable_for fallback by product_type when no actives are detected
+CATEGORY_DEFAULTS = {
+    "serum": ("general_skincare",),
+    "moisturizer": ("dryness", "dehydration"),
+    "cleanser": ("general_skincare",),
+    "toner": ("general_skincare",),
+    "mask": ("general_skincare",),
+}
+
+# Every ingredient keyword as one regex alternation (matched in Postgres)
+_ACTIVE_PATTERN = "|".join(
+    re.escape(active) for active in {**ACTIVE_CONCERN_MAP, **CONTRA_MAP}
+)
+
+# Resolves each candidate name to every active it contains. The keywords are
+# tested one by one with strpos, like the `in` checks this replaced: a single
+# regexp_matches(..., 'g') scan only reports non-overlapping hits, so
+# "vitamin ceramide" would lose "ceramide" to "vitamin c". One pass of the
+# alternation first rejects names without any active.
+_MATCH_ACTIVES = """
+    SELECT c.product_hash, am.ord, am.active, am.is_key_active,
+           am.concerns, am.contras
+    FROM candidates c
+    JOIN active_map am ON strpos(c.name_lower, am.active) > 0
+    WHERE c.name_lower ~ %(active_re)s
+"""
+
+# active_map rows: (ord, active, is_key_active, concerns, contras)
+_ACTIVE_MAP_ROWS = tuple(
+    (i, active, active in ACTIVE_CONCERN_MAP,
+     ACTIVE_CONCERN_MAP.get(active, []), CONTRA_MAP.get(active, []))
+    for i, active in enumerate({**ACTIVE_CONCERN_MAP, **CONTRA_MAP})
+)
+
+# Constant query parameters for promotion, serialised once per container
+_PROMOTE_PARAMS = {
+    "type_map": json.dumps(CATEGORY_TYPE_MAP),
+    "defaults": json.dumps(CATEGORY_DEFAULTS),
+    "active_re": _ACTIVE_PATTERN,
+}
+
+# Candidates promoted (and committed) per batch
+PROMOTE_BATCH_SIZE = 1000
+
+# Rendered CREATE + INSERT for active_map, built on first use
+_active_map_sql = None
+
+# Created during the init phase and reused across warm invocations
+# (plain botocore: the boto3 resource layer isn't needed for one API call)
+_secretsmanager = get_session().create_client("secretsmanager")
+
 _db_conn = None
 
 
+@functools.lru_cache(maxsize=4)
+def _get_secret(secret_arn: str) -> dict:
+    """Fetch and decode a Secrets Manager secret (cached per container)."""
+    return json.loads(
+        _secretsmanager.get_secret_value(SecretId=secret_arn)["SecretString"]
+    )
+
+
 def get_db():
     global _db_conn
     if _db_conn and not _db_conn.closed:
         return _db_conn
-    sm = boto3.client("secretsmanager")
-    secret = json.loads(
-        sm.get_secret_value(SecretId=DB_SECRET_ARN)["SecretString"]
-    )
+    secret = _get_secret(DB_SECRET_ARN)
     _db_conn = psycopg2.connect(
         host=secret["host"], port=secret["port"],
         dbname=secret["database"], user=secret["username"],
@@ -98,22 +156,31 @@ def get_db():
     return _db_conn
 
 
+# Open the connection at import so the secret fetch and connect happen in
+# the (unbilled) init phase; get_db() retries if this fails.
+try:
+    get_db()
+except Exception as e:
+    logger.warning(f"Deferred DB connection to first invocation: {e}")
+
+
 def promote(event, context):
     """Main Lambda handler."""
     conn = get_db()
     cur = conn.cursor()
 
     try:
-        # 1. Find new anonymised products not yet in catalog
-        new_count = _promote_new_products(cur)
+        # 1. Find new anonymised products not yet in catalog (commits per batch)
+        new_count = _promote_new_products(conn, cur)
         logger.info(f"Promoted {new_count} new products to catalog")
 
-        # 2. Update efficacy data for existing catalog entries
-        updated_count = _update_efficacy(cur)
-        logger.info(f"Updated efficacy for {updated_count} existing products")
+        # Catalog signals are re-derivable from anonymised_products on the
+        # next run, so don't wait for the WAL flush at commit.
+        cur.execute("SET LOCAL synchronous_commit = off")
 
-        # 3. Detect review signal trends
-        trend_count = _compute_review_signals(cur)
+        # 2. Update efficacy data and 3. review signal trends, in one pass
+        updated_count, trend_count = _update_catalog_signals(cur)
+        logger.info(f"Updated efficacy for {updated_count} existing products")
         logger.info(f"Computed review signals for {trend_count} products")
 
         conn.commit()
@@ -135,114 +202,148 @@ def promote(event, context):
         cur.close()
 
 
-def _promote_new_products(cur) -> int:
-    """Insert anonymised_products into product_catalog where they don't exist."""
-    cur.execute("""
-        SELECT ap.product_hash, ap.name_clean, ap.category, ap.brand_type,
-               ap.price_tier, ap.efficacy_signals, ap.market_signals,
-               ap.acquisition_lead
-        FROM anonymised_products ap
-        LEFT JOIN product_catalog pc ON pc.product_hash = ap.product_hash
-        WHERE pc.product_hash IS NULL
-          AND ap.name_clean IS NOT NULL
-          AND ap.name_clean != ''
-    """)
-    rows = cur.fetchall()
-    count = 0
-
-    for row in rows:
-        (product_hash, name_clean, category, brand_type,
-         price_tier, efficacy_raw, market_raw, acq_lead) = row
-
-        efficacy = efficacy_raw if isinstance(efficacy_raw, dict) else json.loads(efficacy_raw or "{}")
-        market = market_raw if isinstance(market_raw, dict) else json.loads(market_raw or "{}")
-
-        product_type = CATEGORY_TYPE_MAP.get(category, category.split("-")[-1] if category else "unknown")
-        rating = efficacy.get("rating")
-        efficacy_score = float(rating) if rating else None
-
-        # Derive key_actives and suitable_for from product name
-        name_lower = name_clean.lower() if name_clean else ""
-        key_actives = []
-        suitable_for = set()
-        contraindications = set()
-
-        for active, concerns in ACTIVE_CONCERN_MAP.items():
-            if active in name_lower:
-                key_actives.append(active.replace(" ", "_"))
-                suitable_for.update(concerns)
-
-        for active, contras in CONTRA_MAP.items():
-            if active in name_lower:
-                contraindications.update(contras)
-
-        # If no actives detected, use category defaults
-        if not suitable_for:
-            category_defaults = {
-                "serum": ["general_skincare"],
-                "moisturizer": ["dryness", "dehydration"],
-                "cleanser": ["general_skincare"],
-                "toner": ["general_skincare"],
-                "mask": ["general_skincare"],
-            }
-            suitable_for = set(category_defaults.get(product_type, ["general_skincare"]))
-
-        # Generate display name (clean, no source attribution)
-        display_name = name_clean[:255] if name_clean else f"Unknown {product_type.title()}"
-
-        cur.execute("""
+def _promote_new_products(conn, cur) -> int:
+    """Insert anonymised_products into product_catalog where they don't exist.
+
+    Works in batches of PROMOTE_BATCH_SIZE candidates, each locked with
+    FOR UPDATE SKIP LOCKED and committed on its own, so concurrent runs split
+    the backlog instead of racing on the same rows and transactions stay
+    short.
+
+    Derivation of key_actives / suitable_for / contraindications happens in
+    SQL: the ingredient maps are loaded into a temp table and matched
+    against the lowercased name. The catalog rows and their
+    source_intelligence stubs are written by one statement (the stubs
+    reference product_catalog, so they are taken from the catalog insert's
+    RETURNING), and the temp-table setup is one batch: two round trips per
+    batch.
+    """
+    candidates = """
+        candidates AS (
+            SELECT ap.product_hash, ap.name_clean, lower(ap.name_clean) AS name_lower,
+                   ap.category, ap.price_tier, ap.efficacy_signals,
+                   ap.acq_lead_short, ap.last_updated,
+                   COALESCE(
+                       %(type_map)s::jsonb ->> ap.category,
+                       CASE WHEN COALESCE(ap.category, '') = '' THEN 'unknown'
+                            ELSE regexp_replace(ap.category, '^.*-', '') END
+                   ) AS product_type
+            FROM anonymised_products ap
+            LEFT JOIN product_catalog pc ON pc.product_hash = ap.product_hash
+            WHERE pc.product_hash IS NULL
+              AND ap.name_clean IS NOT NULL
+              AND ap.name_clean != ''
+            LIMIT %(batch_size)s
+            FOR UPDATE OF ap SKIP LOCKED
+        )"""
+    params = {**_PROMOTE_PARAMS, "batch_size": PROMOTE_BATCH_SIZE}
+    sql = f"""
+        WITH {candidates},
+        matched AS ({_MATCH_ACTIVES}),
+        actives AS (
+            SELECT product_hash,
+                   array_agg(replace(active, ' ', '_') ORDER BY ord)
+                       FILTER (WHERE is_key_active) AS key_actives
+            FROM matched GROUP BY product_hash
+        ),
+        concerns AS (
+            SELECT product_hash, array_agg(DISTINCT concern) AS suitable_for
+            FROM matched, unnest(concerns) AS concern
+            GROUP BY product_hash
+        ),
+        contras AS (
+            SELECT product_hash, array_agg(DISTINCT contra) AS contraindications
+            FROM matched, unnest(contras) AS contra
+            GROUP BY product_hash
+        ),
+        promoted AS (
             INSERT INTO product_catalog
                 (product_hash, display_name, category, product_type, price_tier,
                  efficacy_score, review_signals, key_actives, suitable_for,
                  contraindications, status, created_at, updated_at)
-            VALUES (%s, %s, %s, %s, %s, %s, 'stable', %s, %s, %s, 'research', NOW(), NOW())
+            SELECT c.product_hash, LEFT(c.name_clean, 255), c.category,
+                   c.product_type, c.price_tier,
+                   NULLIF((c.efficacy_signals->>'rating')::DECIMAL, 0),
+                   'stable',
+                   a.key_actives,
+                   COALESCE(
+                       cn.suitable_for,
+                       -- No actives detected: fall back to category defaults
+                       ARRAY(SELECT jsonb_array_elements_text(COALESCE(
+                           %(defaults)s::jsonb -> c.product_type,
+                           '["general_skincare"]'::jsonb
+                       )))
+                   ),
+                   ct.contraindications,
+                   'research', NOW(), NOW()
+            FROM candidates c
+            LEFT JOIN actives a ON a.product_hash = c.product_hash
+            LEFT JOIN concerns cn ON cn.product_hash = c.product_hash
+            LEFT JOIN contras ct ON ct.product_hash = c.product_hash
             ON CONFLICT (product_hash) DO NOTHING
-        """, (
-            product_hash, display_name, category, product_type, price_tier,
-            efficacy_score,
-            list(key_actives) if key_actives else None,
-            list(suitable_for) if suitable_for else None,
-            list(contraindications) if contraindications else None,
-        ))
-
-        # Create source_intelligence stub
-        if acq_lead:
-            cur.execute("""
-                INSERT INTO source_intelligence
-                    (acquisition_lead, product_hash, created_at, updated_at)
-                VALUES (%s, %s, NOW(), NOW())
-                ON CONFLICT (acquisition_lead) DO UPDATE SET
-                    product_hash = EXCLUDED.product_hash,
-                    updated_at = NOW()
-            """, (acq_lead[:32], product_hash))
-
-        count += 1
-
-    return count
-
-
-def _update_efficacy(cur) -> int:
-    """Update efficacy_score for existing catalog entries from latest scrape data."""
-    cur.execute("""
-        UPDATE product_catalog pc
-        SET
-            efficacy_score = COALESCE(
-                (ap.efficacy_signals->>'rating')::DECIMAL,
-                pc.efficacy_score
-            ),
-            price_tier = COALESCE(NULLIF(ap.price_tier, 'unknown'), pc.price_tier),
-            updated_at = NOW()
-        FROM anonymised_products ap
-        WHERE ap.product_hash = pc.product_hash
-          AND ap.last_updated > pc.updated_at - interval '1 day'
-    """)
-    return cur.rowcount
-
+            RETURNING product_hash
+        ),
+        -- Source intelligence stubs, one product per lead
+        stubs AS (
+            INSERT INTO source_intelligence
+                (acquisition_lead, product_hash, created_at, updated_at)
+            SELECT DISTINCT ON (c.acq_lead_short)
+                   c.acq_lead_short, c.product_hash, NOW(), NOW()
+            FROM candidates c
+            JOIN promoted p ON p.product_hash = c.product_hash
+            WHERE c.acq_lead_short != ''
+            ORDER BY c.acq_lead_short, c.last_updated DESC
+            ON CONFLICT (acquisition_lead) DO UPDATE SET
+                product_hash = EXCLUDED.product_hash,
+                updated_at = NOW()
+        )
+        SELECT (SELECT count(*) FROM candidates), (SELECT count(*) FROM promoted)
+    """
 
-def _compute_review_signals(cur) -> int:
+    total = 0
+    while True:
+        # A promoted batch is re-derivable from anonymised_products, so
+        # don't wait for the WAL flush at commit. (SET LOCAL and the
+        # ON COMMIT DROP temp table both end with each batch.)
+        cur.execute("SET LOCAL synchronous_commit = off")
+        _load_active_map(cur)
+        cur.execute(sql, params)
+        selected, promoted = cur.fetchone()
+        conn.commit()
+        total += promoted
+        if selected < PROMOTE_BATCH_SIZE:
+            return total
+
+
+def _load_active_map(cur):
+    """Load ACTIVE_CONCERN_MAP / CONTRA_MAP into a transaction-scoped temp table."""
+    global _active_map_sql
+    if _active_map_sql is None:
+        values = b",".join(
+            cur.mogrify("(%s, %s, %s, %s::text[], %s::text[])", row)
+            for row in _ACTIVE_MAP_ROWS
+        )
+        _active_map_sql = b"""
+            CREATE TEMP TABLE IF NOT EXISTS active_map (
+                ord INT,
+                active TEXT,
+                is_key_active BOOLEAN,
+                concerns TEXT[],
+                contras TEXT[]
+            ) ON COMMIT DROP;
+            INSERT INTO active_map VALUES """ + values
+    cur.execute(_active_map_sql)
+
+
+def _update_catalog_signals(cur) -> tuple:
     """
-    Determine review trend: 'trending' if review count grew >20% in 30 days,
-    'declining' if rating dropped >0.3, otherwise 'stable'.
+    Refresh existing catalog entries from the latest scrape data in a single
+    UPDATE. Returns (efficacy_updated, trends_computed).
+
+    - efficacy_score / price_tier: for entries whose anonymised product was
+      updated since the entry (minus a day).
+    - review_signals: 'trending' if review count grew >20% in 30 days,
+      'declining' if rating dropped >0.3, otherwise 'stable'.
     """
     cur.execute("""
         WITH recent AS (
@@ -254,20 +355,47 @@ def _compute_review_signals(cur) -> int:
             SELECT product_hash, efficacy_signals, last_updated
             FROM anonymised_products
             WHERE last_updated BETWEEN NOW() - interval '37 days' AND NOW() - interval '30 days'
+        ),
+        changes AS (
+            SELECT ap.product_hash, ap.efficacy_signals, ap.price_tier,
+                   ap.last_updated > existing.updated_at - interval '1 day' AS efficacy_due,
+                   r.efficacy_signals AS recent_signals,
+                   o.efficacy_signals AS older_signals
+            FROM anonymised_products ap
+            JOIN product_catalog existing ON existing.product_hash = ap.product_hash
+            LEFT JOIN recent r ON r.product_hash = ap.product_hash
+            LEFT JOIN older o ON o.product_hash = r.product_hash
         )
         UPDATE product_catalog pc
-        SET review_signals = CASE
-            WHEN (r.efficacy_signals->>'review_volume')::INT >
-                 (o.efficacy_signals->>'review_volume')::INT * 1.2
-            THEN 'trending'
-            WHEN (r.efficacy_signals->>'rating')::DECIMAL <
-                 (o.efficacy_signals->>'rating')::DECIMAL - 0.3
-            THEN 'declining'
-            ELSE 'stable'
-        END,
-        updated_at = NOW()
-        FROM recent r
-        JOIN older o ON o.product_hash = r.product_hash
-        WHERE pc.product_hash = r.product_hash
+        SET
+            efficacy_score = CASE
+                WHEN c.efficacy_due
+                THEN COALESCE((c.efficacy_signals->>'rating')::DECIMAL, pc.efficacy_score)
+                ELSE pc.efficacy_score
+            END,
+            price_tier = CASE
+                WHEN c.efficacy_due
+                THEN COALESCE(NULLIF(c.price_tier, 'unknown'), pc.price_tier)
+                ELSE pc.price_tier
+            END,
+            review_signals = CASE
+                WHEN c.older_signals IS NULL THEN pc.review_signals
+                WHEN (c.recent_signals->>'review_volume')::INT >
+                     (c.older_signals->>'review_volume')::INT * 1.2
+                THEN 'trending'
+                WHEN (c.recent_signals->>'rating')::DECIMAL <
+                     (c.older_signals->>'rating')::DECIMAL - 0.3
+                THEN 'declining'
+                ELSE 'stable'
+            END,
+            updated_at = NOW()
+        FROM changes c
+        WHERE pc.product_hash = c.product_hash
+          AND (c.efficacy_due OR c.older_signals IS NOT NULL)
+        RETURNING c.efficacy_due, c.older_signals IS NOT NULL
     """)
-    return cur.rowcount
+    flags = cur.fetchall()
+    return (
+        sum(1 for efficacy, _ in flags if efficacy),
+        sum(1 for _, trend in flags if trend),
+    )
@@ -15,17 +15,23 @@ Environment:
   EXPORT_BUCKET  - S3 bucket name for exports
 """
 
+import functools
 import hashlib
+import io
+import itertools
 import json
 import logging
 import os
 import re
-from datetime import datetime, timedelta
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
 import boto3
+import orjson
 import psycopg2
-from psycopg2.extras import execute_values
+from psycopg2.extras import Json
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -36,6 +42,21 @@ RAW_BUCKET = os.environ["RAW_BUCKET"]
 EXPORT_BUCKET = os.environ.get("EXPORT_BUCKET", "")
 
 PRICE_ALERT_THRESHOLD = 0.15  # 15% swing triggers alert
+S3_FETCH_WORKERS = 16  # parallel get_object calls; DB writes stay serial
+# Downloads allowed ahead of the serial DB writes, per fetch worker; bounds
+# how many payloads sit in memory at once
+S3_PREFETCH_PER_WORKER = 2
+RAW_SOURCES = ("sephora_de", "amazon_de", "ulta")  # listed by the scheduled run
+UNCHANGED_TTL_SECONDS = 3600  # repeat (product, price) sightings skipped for this long
+UNCHANGED_MAX_ENTRIES = 500_000
+
+# TCP keepalives so idle warm-container connections survive NAT/RDS timeouts
+DB_KEEPALIVES = {
+    "keepalives": 1,
+    "keepalives_idle": 30,
+    "keepalives_interval": 10,
+    "keepalives_count": 3,
+}
 
 LUXURY_BRANDS = {
     "la mer", "sk-ii", "la prairie", "sisley", "tom ford", "chanel",
@@ -47,22 +68,62 @@ MASSTIGE_BRANDS = {
     "l'oreal", "garnier", "nivea", "eucerin", "cerave",
     "mac", "urban decay", "tarte", "too faced", "benefit",
 }
+# Single lookup table for _classify_brand; luxury wins if a brand is in both
+_BRAND_TIER = {b: "masstige" for b in MASSTIGE_BRANDS} | {b: "luxury" for b in LUXURY_BRANDS}
+
+_RE_EUROPEAN_PRICE = re.compile(r"(\d+),(\d{2})$")
+_RE_PREFIX = re.compile(r"^[A-Za-z:]+")
+_RE_NUM = re.compile(r"(\d+\.?\d*)")
+_RE_RATING_DEC = re.compile(r"(\d+[.,]\d+)")
+_RE_RATING_INT = re.compile(r"(\d+)")
+_RE_NAME_CLEAN = re.compile(r"[^\w\s\-&/]")
+# ASCII part of _RE_NAME_CLEAN as a translate table (drops punctuation)
+_NAME_TRANS = str.maketrans({
+    c: None for c in map(chr, range(128))
+    if not (c.isalnum() or c.isspace() or c in "_-&/")
+})
 
 
 # ── DB connection ───────────────────────────────────────────────
+# Created once per container and reused across warm invocations
+_secretsmanager = boto3.client("secretsmanager")
+_s3 = boto3.client("s3")
+
 _db_conn = None
 
+# (source, ext_id, price) digests written recently -> monotonic time written.
+# Lives for the container's lifetime, so warm invocations share it.
+_recent_rows = {}
+
+
+@functools.lru_cache(maxsize=4)
+def _get_secret(secret_arn: str) -> dict:
+    """Fetch and decode a Secrets Manager secret (cached per container)."""
+    return json.loads(
+        _secretsmanager.get_secret_value(SecretId=secret_arn)["SecretString"]
+    )
+
+
+def _is_alive(conn) -> bool:
+    """Cheap round trip to detect connections dropped while the container idled."""
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+        conn.rollback()
+        return True
+    except psycopg2.Error:
+        return False
+
 
 def get_db_connection():
     global _db_conn
     if _db_conn and not _db_conn.closed:
-        return _db_conn
-
-    sm = boto3.client("secretsmanager")
-    secret = json.loads(
-        sm.get_secret_value(SecretId=DB_SECRET_ARN)["SecretString"]
-    )
+        if _is_alive(_db_conn):
+            return _db_conn
+        logger.info("Stale DB connection, reconnecting")
+        _db_conn.close()
 
+    secret = _get_secret(DB_SECRET_ARN)
     _db_conn = psycopg2.connect(
         host=secret["host"],
         port=secret["port"],
@@ -70,6 +131,7 @@ def get_db_connection():
         user=secret["username"],
         password=secret["password"],
         connect_timeout=10,
+        **DB_KEEPALIVES,
     )
     _db_conn.autocommit = False
     return _db_conn
@@ -82,9 +144,10 @@ def process(event, context):
     - S3 event: processes a specific uploaded file
     - CloudWatch scheduled event: processes all files from today
     """
-    logger.info(f"Event: {json.dumps(event, default=str)[:500]}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Event: {_event_preview(event)}")
 
-    s3 = boto3.client("s3")
+    s3 = _s3
 
     # Determine which files to process
     keys_to_process = []
@@ -97,17 +160,13 @@ def process(event, context):
             if key.endswith(".json") and not key.startswith("_runs/"):
                 keys_to_process.append(key)
     else:
-        # Scheduled trigger: process all files from today
+        # Scheduled trigger: process all files from today, listing the
+        # per-source prefixes concurrently
         today = datetime.utcnow().strftime("%Y-%m-%d")
-        for source in ["sephora_de", "amazon_de", "ulta"]:
-            prefix = f"{source}/{today}/"
-            try:
-                resp = s3.list_objects_v2(Bucket=RAW_BUCKET, Prefix=prefix)
-                for obj in resp.get("Contents", []):
-                    if obj["Key"].endswith(".json"):
-                        keys_to_process.append(obj["Key"])
-            except Exception as e:
-                logger.error(f"Error listing {prefix}: {e}")
+        prefixes = [f"{source}/{today}/" for source in RAW_SOURCES]
+        with ThreadPoolExecutor(max_workers=len(prefixes)) as ex:
+            for keys in ex.map(lambda prefix: _list_json_keys(s3, prefix), prefixes):
+                keys_to_process.extend(keys)
 
     if not keys_to_process:
         logger.info("No files to process")
@@ -116,24 +175,41 @@ def process(event, context):
     total_products = 0
     total_alerts = 0
 
-    for key in keys_to_process:
-        try:
-            logger.info(f"Processing: s3://{RAW_BUCKET}/{key}")
-            resp = s3.get_object(Bucket=RAW_BUCKET, Key=key)
-            payload = json.loads(resp["Body"].read())
-
-            products = payload.get("products", [])
-            source = payload.get("source", _infer_source(key))
-
-            n_inserted, n_alerts = _process_products(source, products)
-            total_products += n_inserted
-            total_alerts += n_alerts
-
-        except Exception as e:
-            logger.error(f"Error processing {key}: {e}", exc_info=True)
-
-    # Run daily aggregation
-    _compute_aggregates()
+    # Download in parallel; feed payloads into the DB from this thread only
+    # since the psycopg2 connection is not shared across threads. Downloads
+    # outpace the DB writes, so only a bounded window is kept in flight.
+    workers = min(S3_FETCH_WORKERS, len(keys_to_process))
+    pending_keys = iter(keys_to_process)
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        futures = {
+            ex.submit(_load_payload, s3, key): key
+            for key in itertools.islice(pending_keys, workers * S3_PREFETCH_PER_WORKER)
+        }
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = futures.pop(future)
+                # Refill the window before the (slower) DB write
+                for next_key in itertools.islice(pending_keys, 1):
+                    futures[ex.submit(_load_payload, s3, next_key)] = next_key
+                try:
+                    payload = future.result()
+                    logger.info(f"Processing: s3://{RAW_BUCKET}/{key}")
+
+                    products = payload.get("products", [])
+                    source = payload.get("source", _infer_source(key))
+
+                    n_inserted, n_alerts = _process_products(source, products)
+                    total_products += n_inserted
+                    total_alerts += n_alerts
+
+                except Exception as e:
+                    logger.error(f"Error processing {key}: {e}", exc_info=True)
+
+    # Daily aggregation runs once on the scheduled sweep; per-file S3
+    # triggers would otherwise redo the same 24h GROUP BY many times a day.
+    if "Records" not in event:
+        _compute_aggregates()
 
     logger.info(
         f"Done: {total_products} products processed, {total_alerts} alerts "
@@ -149,37 +225,65 @@ def process(event, context):
 
 # ── Core processing ─────────────────────────────────────────────
 def _process_products(source: str, products: list) -> tuple:
-    """Upsert products, record prices, generate anonymised records, detect alerts."""
+    """Upsert products, record prices, generate anonymised records, detect alerts.
+
+    All writes for a payload are batched (UNNEST-based upserts, COPY
+    for the append-only price_history) and committed in a single transaction.
+    Products already written at the same price within UNCHANGED_TTL_SECONDS
+    only have their products row refreshed.
+    """
     conn = get_db_connection()
     cur = conn.cursor()
-    alerts_count = 0
 
     try:
-        for raw in products:
-            # 1. Upsert into products table
-            product_id = _upsert_product(cur, source, raw)
+        # 1. Upsert into products table
+        ext_ids = [_external_id(raw) for raw in products]
+        product_ids = _upsert_products(cur, source, products, ext_ids)
+
+        currency = "EUR" if "de" in source else "USD"
+        price_rows = []
+        new_prices = {}
+        anonymised_rows = {}
+        lead_month = datetime.utcnow().strftime("%Y%m")
+        now = time.monotonic()
+        written_keys = []
+        skipped = 0
+
+        for raw, ext_id in zip(products, ext_ids):
+            product_id = product_ids.get(ext_id)
             if not product_id:
                 continue
 
-            # 2. Record price history
             price = _parse_price(raw.get("price") or raw.get("price_text", ""))
-            currency = "EUR" if "de" in source else "USD"
+
+            # Same product at the same price written within the TTL: nothing
+            # new for price_history, alerts or the anonymised row.
+            row_key = _row_key(source, ext_id, price)
+            if now - _recent_rows.get(row_key, float("-inf")) < UNCHANGED_TTL_SECONDS:
+                skipped += 1
+                continue
+            written_keys.append(row_key)
+
+            # 2. Record price history
             if price:
-                cur.execute(
-                    """INSERT INTO price_history (product_id, price, currency, in_stock, scraped_at)
-                       VALUES (%s, %s, %s, %s, NOW())""",
-                    (product_id, price, currency, True),
-                )
+                price_rows.append((product_id, price, currency, True))
+                new_prices[product_id] = price
 
-                # 3. Check for price alert
-                if _check_price_alert(cur, product_id, price):
-                    alerts_count += 1
+            # 3. Anonymised product (last occurrence of a hash wins)
+            row = _anonymised_row(source, raw, price, lead_month)
+            anonymised_rows[row[0]] = row
 
-            # 4. Upsert anonymised product
-            _upsert_anonymised(cur, source, raw, product_id)
+        # 4. Detect price alerts against the previous recorded prices
+        alerts_count = _check_price_alerts(cur, new_prices)
+        _copy_price_history(cur, price_rows)
+        _upsert_anonymised(cur, list(anonymised_rows.values()))
 
         conn.commit()
-        logger.info(f"Processed {len(products)} products for {source}")
+        _remember_rows(written_keys, now)
+        logger.info(
+            f"Processed {len(products)} products for {source} "
+            f"({skipped} unchanged since last scrape)"
+        )
         return len(products), alerts_count
 
     except Exception as e:
@@ -190,8 +294,25 @@ def _process_products(source: str, products: list) -> tuple:
         cur.close()
 
 
-def _upsert_product(cur, source: str, raw: dict) -> int:
-    """Insert or update a product record. Returns the product id."""
+def _row_key(source: str, ext_id: str, price) -> bytes:
+    """Compact digest identifying a (source, product, price) sighting."""
+    return hashlib.blake2b(f"{source}:{ext_id}:{price}".encode(), digest_size=8).digest()
+
+
+def _remember_rows(keys: list, now: float):
+    """Record committed sightings, evicting expired ones when the cache is full."""
+    for key in keys:
+        _recent_rows[key] = now
+    if len(_recent_rows) > UNCHANGED_MAX_ENTRIES:
+        cutoff = now - UNCHANGED_TTL_SECONDS
+        for key in [k for k, t in _recent_rows.items() if t < cutoff]:
+            del _recent_rows[key]
+        if len(_recent_rows) > UNCHANGED_MAX_ENTRIES:
+            _recent_rows.clear()
+
+
+def _external_id(raw: dict) -> str:
+    """Source-side product id, falling back to a name/brand digest."""
     ext_id = (
         raw.get("source_id")
         or raw.get("pid")
@@ -203,22 +324,43 @@ def _upsert_product(cur, source: str, raw: dict) -> int:
         ext_id = hashlib.md5(
             f"{raw.get('name','')}:{raw.get('brand','')}".encode()
         ).hexdigest()[:16]
+    return str(ext_id)
 
-    name = raw.get("name", "")
-    brand = raw.get("brand", "")
-    category = raw.get("category", "")
-    url = raw.get("url") or raw.get("url_path") or ""
-    image_url = raw.get("image_url") or (
-        raw["image_urls"][0] if raw.get("image_urls") else None
-    )
-    rating = _parse_rating(raw.get("rating") or raw.get("rating_text"))
-    review_count = raw.get("review_count", 0)
 
+def _upsert_products(cur, source: str, products: list, ext_ids: list) -> dict:
+    """Insert or update product records. Returns {external_id: product id}."""
+    # ON CONFLICT DO UPDATE cannot touch the same row twice in one
+    # statement, so collapse duplicate ids (last occurrence wins).
+    rows = {}
+    for raw, ext_id in zip(products, ext_ids):
+        image_url = raw.get("image_url") or (
+            raw["image_urls"][0] if raw.get("image_urls") else None
+        )
+        rows[ext_id] = (
+            source,
+            ext_id,
+            raw.get("name", ""),
+            raw.get("brand", ""),
+            raw.get("category", ""),
+            raw.get("url") or raw.get("url_path") or "",
+            image_url,
+            _parse_rating(raw.get("rating") or raw.get("rating_text")),
+            raw.get("review_count", 0),
+        )
+    if not rows:
+        return {}
+
+    # Columnar arrays + UNNEST: one statement whose text doesn't grow with
+    # the batch, instead of pages of VALUES tuples.
     cur.execute(
         """INSERT INTO products
                (source, external_id, name, brand, category, url, image_url,
                 rating, review_count, first_seen_at, last_seen_at)
-           VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW())
+           SELECT t.*, NOW(), NOW()
+           FROM UNNEST(%s::text[], %s::text[], %s::text[], %s::text[], %s::text[],
+                       %s::text[], %s::text[], %s::numeric[], %s::int[])
+                AS t(source, external_id, name, brand, category, url, image_url,
+                     rating, review_count)
            ON CONFLICT (source, external_id) DO UPDATE SET
                name = EXCLUDED.name,
                brand = COALESCE(NULLIF(EXCLUDED.brand, ''), products.brand),
@@ -228,47 +370,75 @@ def _upsert_product(cur, source: str, raw: dict) -> int:
                rating = COALESCE(EXCLUDED.rating, products.rating),
                review_count = GREATEST(EXCLUDED.review_count, products.review_count),
                last_seen_at = NOW()
-           RETURNING id""",
-        (source, ext_id, name, brand, category, url, image_url, rating, review_count),
+           RETURNING id, external_id""",
+        [list(col) for col in zip(*rows.values())],
+    )
+    return {ext_id: product_id for product_id, ext_id in cur.fetchall()}
+
+
+def _copy_price_history(cur, rows: list):
+    """Stream (product_id, price, currency, in_stock) rows into price_history via COPY."""
+    if not rows:
+        return
+    scraped_at = datetime.now(timezone.utc).isoformat()
+    buf = io.StringIO()
+    for product_id, price, currency, in_stock in rows:
+        buf.write(f"{product_id}\t{price}\t{currency}\t{'t' if in_stock else 'f'}\t{scraped_at}\n")
+    buf.seek(0)
+    cur.copy_expert(
+        "COPY price_history (product_id, price, currency, in_stock, scraped_at) "
+        "FROM STDIN WITH (FORMAT text)",
+        buf,
     )
-    row = cur.fetchone()
-    return row[0] if row else None
 
 
-def _check_price_alert(cur, product_id: int, new_price: float) -> bool:
-    """Detect >15% price swings and insert alert."""
+def _check_price_alerts(cur, new_prices: dict) -> int:
+    """Detect >15% price swings for {product_id: new_price} and insert alerts.
+
+    The previous-price lookup, threshold check and insert run server-side as
+    one statement, so the batch costs a single round trip. The previous price
+    is the latest one recorded between 7 days and 1 hour ago; the window keeps
+    the lookup to the newest price_history partitions.
+    """
+    if not new_prices:
+        return 0
+
     cur.execute(
-        """SELECT price FROM price_history
-           WHERE product_id = %s AND scraped_at < NOW() - interval '1 hour'
-           ORDER BY scraped_at DESC LIMIT 1""",
-        (product_id,),
+        """WITH batch AS (
+               SELECT b.pid, b.new_price,
+                      (SELECT ph.price FROM price_history ph
+                       WHERE ph.product_id = b.pid
+                         AND ph.scraped_at < NOW() - interval '1 hour'
+                         -- Lower bound so only the newest partitions are probed
+                         AND ph.scraped_at >= NOW() - interval '7 days'
+                       ORDER BY ph.scraped_at DESC LIMIT 1) AS old_price
+               FROM unnest(%s::int[], %s::numeric[]) AS b(pid, new_price)
+           )
+           INSERT INTO price_alerts
+               (product_id, old_price, new_price, change_pct, detected_at)
+           SELECT pid, old_price, new_price,
+                  ROUND((new_price - old_price) / old_price * 100, 2), NOW()
+           FROM batch
+           WHERE old_price > 0
+             AND ABS(new_price - old_price) / old_price >= %s
+           RETURNING product_id, old_price, new_price, change_pct""",
+        (list(new_prices), list(new_prices.values()), PRICE_ALERT_THRESHOLD),
     )
-    row = cur.fetchone()
-    if not row or not row[0]:
-        return False
 
-    old_price = float(row[0])
-    if old_price == 0:
-        return False
-
-    change_pct = (new_price - old_price) / old_price
-    if abs(change_pct) >= PRICE_ALERT_THRESHOLD:
-        cur.execute(
-            """INSERT INTO price_alerts
-                   (product_id, old_price, new_price, change_pct, detected_at)
-               VALUES (%s, %s, %s, %s, NOW())""",
-            (product_id, old_price, new_price, round(change_pct * 100, 2)),
-        )
+    alerts = cur.fetchall()
+    for product_id, old_price, new_price, change_pct in alerts:
         logger.info(
             f"ALERT: product {product_id} price changed "
-            f"{old_price} -> {new_price} ({change_pct:+.1%})"
+            f"{old_price} -> {new_price} ({change_pct:+}%)"
         )
-        return True
-    return False
+    return len(alerts)
+
 
+def _anonymised_row(source: str, raw: dict, price: float, lead_month: str) -> tuple:
+    """Build the anonymised_products row for frontend consumption.
 
-def _upsert_anonymised(cur, source: str, raw: dict, product_id: int):
-    """Create/update anonymised product for frontend consumption."""
+    `lead_month` is the %Y%m bucket for acquisition_lead, computed once per batch.
+    """
     name = raw.get("name", "")
     brand = raw.get("brand", "")
     ext_id = raw.get("source_id") or raw.get("pid") or raw.get("asin") or ""
@@ -277,9 +447,8 @@ def _upsert_anonymised(cur, source: str, raw: dict, product_id: int):
         f"{brand}:{name}:{ext_id}".encode()
     ).hexdigest()
 
-    name_clean = re.sub(r"\s+", " ", re.sub(r"[^\w\s\-&/]", "", name)).strip()[:500]
+    name_clean = _clean_name(name)
     brand_type = _classify_brand(brand)
-    price = _parse_price(raw.get("price") or raw.get("price_text", ""))
     price_tier = _price_tier(price)
 
     rating = _parse_rating(raw.get("rating") or raw.get("rating_text"))
@@ -297,15 +466,43 @@ def _upsert_anonymised(cur, source: str, raw: dict, product_id: int):
         "stock_status": raw.get("availability", "unknown"),
     }
 
-    acquisition_lead = hashlib.sha256(
-        f"{ext_id}:{brand}:{datetime.utcnow().strftime('%Y%m')}".encode()
-    ).hexdigest()[:16]
+    # Opaque monthly bucket id, not a security boundary: an 8-byte blake2b
+    # digest gives the same 16 hex chars without hashing a full sha256.
+    acquisition_lead = hashlib.blake2b(
+        f"{ext_id}:{brand}:{lead_month}".encode(),
+        digest_size=8,
+    ).hexdigest()
+
+    return (
+        product_hash,
+        raw.get("category", "").replace("_", "-"),
+        name_clean,
+        brand_type,
+        price_tier,
+        Json(efficacy, dumps=_json_dumps),
+        Json(market, dumps=_json_dumps),
+        acquisition_lead,
+    )
+
 
+def _upsert_anonymised(cur, rows: list):
+    """Create/update anonymised products for frontend consumption.
+
+    Rows are sent column-wise as arrays and expanded with UNNEST, so the
+    whole batch is a single statement regardless of size.
+    """
+    if not rows:
+        return
+    columns = [list(col) for col in zip(*rows)]
     cur.execute(
         """INSERT INTO anonymised_products
                (product_hash, category, name_clean, brand_type, price_tier,
                 efficacy_signals, market_signals, acquisition_lead, last_updated)
-           VALUES (%s, %s, %s, %s, %s, %s, %s, %s, NOW())
+           SELECT t.*, NOW()
+           FROM UNNEST(%s::text[], %s::text[], %s::text[], %s::text[], %s::text[],
+                       %s::jsonb[], %s::jsonb[], %s::text[])
+                AS t(product_hash, category, name_clean, brand_type, price_tier,
+                     efficacy_signals, market_signals, acquisition_lead)
            ON CONFLICT (product_hash) DO UPDATE SET
                category = COALESCE(NULLIF(EXCLUDED.category, ''), anonymised_products.category),
                name_clean = EXCLUDED.name_clean,
@@ -315,16 +512,7 @@ def _upsert_anonymised(cur, source: str, raw: dict, product_id: int):
                market_signals = EXCLUDED.market_signals,
                acquisition_lead = EXCLUDED.acquisition_lead,
                last_updated = NOW()""",
-        (
-            product_hash,
-            raw.get("category", "").replace("_", "-"),
-            name_clean,
-            brand_type,
-            price_tier,
-            json.dumps(efficacy),
-            json.dumps(market),
-            acquisition_lead,
-        ),
+        columns,
     )
 
 
@@ -371,6 +559,40 @@ def _compute_aggregates(cur=None):
 
 
 # ── Helpers ─────────────────────────────────────────────────────
+def _event_preview(event: dict, limit: int = 500) -> str:
+    """Short log line for an event without serialising every S3 record."""
+    records = event.get("Records")
+    if records:
+        first = records[0].get("s3", {}).get("object", {}).get("key", "?")
+        return f"{len(records)} S3 record(s), first key {first}"
+    return repr(event)[:limit]
+
+
+def _json_dumps(obj) -> str:
+    """orjson-backed serializer for psycopg2's Json adapter."""
+    return orjson.dumps(obj).decode()
+
+
+def _list_json_keys(s3, prefix: str) -> list:
+    """All .json keys under `prefix`, following list_objects_v2 pagination."""
+    keys = []
+    try:
+        paginator = s3.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=RAW_BUCKET, Prefix=prefix):
+            for obj in page.get("Contents", []):
+                if obj["Key"].endswith(".json"):
+                    keys.append(obj["Key"])
+    except Exception as e:
+        logger.error(f"Error listing {prefix}: {e}")
+    return keys
+
+
+def _load_payload(s3, key: str) -> dict:
+    """Download and decode one raw JSON payload from the raw bucket."""
+    resp = s3.get_object(Bucket=RAW_BUCKET, Key=key)
+    return orjson.loads(resp["Body"].read())
+
+
 def _infer_source(s3_key: str) -> str:
     """Infer source from S3 key path (e.g., 'sephora_de/2024-01-15/...')."""
     parts = s3_key.split("/")
@@ -382,11 +604,18 @@ def _parse_price(price_text: str) -> float:
     if not price_text:
         return 0.0
     cleaned = str(price_text).replace("EUR", "").replace("$", "").replace("\xa0", "").strip()
+    # Fast path for the plain formats scrapers emit: '34.00', '34', '29,95'
+    if cleaned.isascii() and cleaned[:1].isdigit():
+        head, sep, tail = cleaned.partition(",")
+        if not sep and head.replace(".", "", 1).isdigit():
+            return float(head)
+        if sep and head.isdigit() and len(tail) == 2 and tail.isdigit():
+            return float(f"{head}.{tail}")
     # Handle European format: 29,95
-    cleaned = re.sub(r"(\d+),(\d{2})$", r"\1.\2", cleaned)
+    cleaned = _RE_EUROPEAN_PRICE.sub(r"\1.\2", cleaned)
     # Handle "Ab:8,95" pattern
-    cleaned = re.sub(r"^[A-Za-z:]+", "", cleaned)
-    match = re.search(r"(\d+\.?\d*)", cleaned)
+    cleaned = _RE_PREFIX.sub("", cleaned)
+    match = _RE_NUM.search(cleaned)
     return float(match.group(1)) if match else 0.0
 
 
@@ -395,10 +624,10 @@ def _parse_rating(rating_text) -> float:
     if rating_text is None:
         return None
     text = str(rating_text)
-    match = re.search(r"(\d+[.,]\d+)", text)
+    match = _RE_RATING_DEC.search(text)
     if match:
         return float(match.group(1).replace(",", "."))
-    match = re.search(r"(\d+)", text)
+    match = _RE_RATING_INT.search(text)
     if match:
         val = int(match.group(1))
         if 1 <= val <= 5:
@@ -406,13 +635,18 @@ def _parse_rating(rating_text) -> float:
     return None
 
 
+def _clean_name(name: str) -> str:
+    """Strip punctuation and collapse whitespace, capped at 500 chars."""
+    cleaned = name.translate(_NAME_TRANS)
+    if not cleaned.isascii():
+        # Non-ASCII punctuation (™, ®, …) still needs the Unicode-aware regex
+        cleaned = _RE_NAME_CLEAN.sub("", cleaned)
+    return " ".join(cleaned.split())[:500]
+
+
+@functools.lru_cache(maxsize=4096)
 def _classify_brand(brand: str) -> str:
-    lower = brand.lower().strip()
-    if lower in LUXURY_BRANDS:
-        return "luxury"
-    if lower in MASSTIGE_BRANDS:
-        return "masstige"
-    return "indie"
+    return _BRAND_TIER.get(brand.lower().strip(), "indie")
 
 
 def _price_tier(price: float) -> str:
@@ -0,0 +1,17 @@
+-- Migration 003: anonymised_products recency index
+-- The catalog promoter selects anonymised products by last_updated windows
+-- (last 7 days, 30-37 days ago). This index turns those window filters into
+-- range scans; INCLUDE lets them be answered from the index alone.
+-- Run AFTER 002_product_catalog.sql
+-- CONCURRENTLY cannot run inside a transaction block: apply with plain psql
+-- (no --single-transaction).
+
+-- ── INDEXES ─────────────────────────────────────────────────────
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_ap_last_updated
+    ON anonymised_products(last_updated DESC)
+    INCLUDE (product_hash, efficacy_signals);
+
+-- ── MIGRATION LOG ───────────────────────────────────────────────
+INSERT INTO schema_migrations (version, description)
+VALUES ('003', 'anonymised_products last_updated index')
+ON CONFLICT (version) DO NOTHING;
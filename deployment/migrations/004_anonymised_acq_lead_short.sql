@@ -0,0 +1,16 @@
+-- Migration 004: anonymised_products.acq_lead_short
+-- source_intelligence.acquisition_lead is VARCHAR(32); the catalog promoter
+-- links stubs through the truncated lead. Store the truncation once per row
+-- instead of recomputing LEFT(acquisition_lead, 32) on every promotion.
+-- Run AFTER 003_anonymised_last_updated_index.sql
+-- Adding a STORED generated column rewrites anonymised_products.
+
+-- ── COLUMNS ─────────────────────────────────────────────────────
+ALTER TABLE anonymised_products
+    ADD COLUMN IF NOT EXISTS acq_lead_short VARCHAR(32)
+    GENERATED ALWAYS AS (substring(acquisition_lead, 1, 32)) STORED;
+
+-- ── MIGRATION LOG ───────────────────────────────────────────────
+INSERT INTO schema_migrations (version, description)
+VALUES ('004', 'anonymised_products acq_lead_short generated column')
+ON CONFLICT (version) DO NOTHING;
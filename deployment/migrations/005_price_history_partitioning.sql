@@ -0,0 +1,161 @@
+-- Migration 005: Partition price_history by scraped_at
+-- price_history is append-only and every hot query (price_aggregates,
+-- price_alerts, out-of-stock tags, latest-price export) is bounded to the
+-- last few days. Monthly RANGE partitions let the planner prune those
+-- scans to the newest one or two children instead of walking the whole
+-- history, while keeping the partition count at twelve a year.
+-- Queries only prune when they bound scraped_at from below; per-product
+-- "latest price" lookups must carry a window too, or they probe every
+-- partition.
+-- Run AFTER 004_anonymised_acq_lead_short.sql
+-- Rewrites price_history: run in a maintenance window, scrapers paused.
+-- Partitions are kept ahead by maintain_price_history_partitions(); it is
+-- scheduled with pg_cron when that extension is installed, otherwise call it
+-- daily from the scheduler of your choice.
+
+BEGIN;
+
+-- ── SWAP IN PARTITIONED TABLE ───────────────────────────────────
+-- The primary key of a partitioned table must include the partition key,
+-- so id alone is no longer unique-constrained (it still comes from the
+-- same sequence). Nothing references price_history(id).
+ALTER TABLE price_history RENAME TO price_history_unpartitioned;
+ALTER INDEX IF EXISTS idx_price_history_product RENAME TO idx_price_history_product_old;
+ALTER INDEX IF EXISTS idx_price_history_scraped RENAME TO idx_price_history_scraped_old;
+
+CREATE TABLE price_history (
+    id INTEGER NOT NULL DEFAULT nextval('price_history_id_seq'),
+    product_id INTEGER NOT NULL REFERENCES products(id) ON DELETE CASCADE,
+    price NUMERIC(10,2) NOT NULL,
+    currency VARCHAR(10) DEFAULT 'EUR',
+    sale_price NUMERIC(10,2),
+    in_stock BOOLEAN DEFAULT TRUE,
+    scraped_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (id, scraped_at)
+) PARTITION BY RANGE (scraped_at);
+
+-- Re-own the sequence so dropping the old table below keeps it.
+ALTER SEQUENCE price_history_id_seq OWNED BY price_history.id;
+
+-- Catches rows outside every monthly range (backfills, clock skew) so
+-- inserts never fail on a missing partition.
+CREATE TABLE price_history_default PARTITION OF price_history DEFAULT;
+
+-- ── INDEXES ─────────────────────────────────────────────────────
+-- Created on the parent, cascaded to every partition. (product_id,
+-- scraped_at DESC) serves the windowed "previous price" lookups.
+CREATE INDEX idx_price_history_product ON price_history(product_id, scraped_at DESC);
+CREATE INDEX idx_price_history_scraped ON price_history(scraped_at);
+
+-- ── PARTITION MAINTENANCE ───────────────────────────────────────
+-- Creates monthly partitions from `months_back` months ago to `months_ahead`
+-- months from now and drops monthly partitions that ended more than
+-- `retain_months` months ago (NULL keeps all).
+-- Postgres refuses a new partition while the default one holds rows in its
+-- range (a missed run, a future-dated scrape), so each month is built as a
+-- plain table, those rows are moved into it, and it is then attached. A
+-- month that still fails is logged and skipped; the rest are still created.
+CREATE OR REPLACE FUNCTION maintain_price_history_partitions(
+    months_back INTEGER DEFAULT 0,
+    months_ahead INTEGER DEFAULT 2,
+    retain_months INTEGER DEFAULT NULL
+) RETURNS VOID AS $$
+DECLARE
+    this_month DATE := date_trunc('month', CURRENT_DATE)::date;
+    part_month DATE;
+    part_name TEXT;
+    part RECORD;
+BEGIN
+    FOR part_month IN
+        SELECT d::date
+        FROM generate_series(this_month - make_interval(months => months_back),
+                             this_month + make_interval(months => months_ahead),
+                             INTERVAL '1 month') AS d
+    LOOP
+        part_name := 'price_history_' || to_char(part_month, 'YYYYMM');
+        CONTINUE WHEN to_regclass(part_name) IS NOT NULL;
+
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE %I (LIKE price_history INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+                part_name
+            );
+            EXECUTE format(
+                'WITH moved AS ('
+                '    DELETE FROM price_history_default'
+                '    WHERE scraped_at >= %L AND scraped_at < %L RETURNING *'
+                ') INSERT INTO %I SELECT * FROM moved',
+                part_month, (part_month + INTERVAL '1 month')::date, part_name
+            );
+            EXECUTE format(
+                'ALTER TABLE price_history ATTACH PARTITION %I '
+                'FOR VALUES FROM (%L) TO (%L)',
+                part_name, part_month, (part_month + INTERVAL '1 month')::date
+            );
+        EXCEPTION WHEN OTHERS THEN
+            RAISE WARNING 'price_history: could not create partition %: %',
+                part_name, SQLERRM;
+        END;
+    END LOOP;
+
+    IF retain_months IS NOT NULL THEN
+        FOR part IN
+            SELECT c.relname
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = 'price_history'::regclass
+              AND c.relname ~ '^price_history_[0-9]{6}$'
+              AND to_date(right(c.relname, 6), 'YYYYMM')
+                  < this_month - make_interval(months => retain_months + 1)
+        LOOP
+            EXECUTE format('DROP TABLE %I', part.relname);
+        END LOOP;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Monthly partitions for everything we already hold, plus two months ahead.
+SELECT maintain_price_history_partitions(
+    COALESCE((
+        SELECT (EXTRACT(YEAR FROM span) * 12 + EXTRACT(MONTH FROM span))::int
+        FROM (
+            SELECT age(date_trunc('month', CURRENT_DATE),
+                       date_trunc('month', MIN(scraped_at))) AS span
+            FROM price_history_unpartitioned
+        ) oldest
+    ), 0),
+    2
+);
+
+-- ── DATA ────────────────────────────────────────────────────────
+INSERT INTO price_history (id, product_id, price, currency, sale_price, in_stock, scraped_at)
+SELECT id, product_id, price, currency, sale_price, in_stock, COALESCE(scraped_at, NOW())
+FROM price_history_unpartitioned;
+
+DROP TABLE price_history_unpartitioned;
+
+ANALYZE price_history;
+
+-- ── SCHEDULE ────────────────────────────────────────────────────
+-- Keep two months of partitions ahead, checked every day at 00:05 UTC
+-- (a no-op unless a month is missing).
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+        PERFORM cron.schedule(
+            'price_history_partitions',
+            '5 0 * * *',
+            'SELECT maintain_price_history_partitions()'
+        );
+    ELSE
+        RAISE NOTICE 'pg_cron not installed: schedule maintain_price_history_partitions() daily';
+    END IF;
+END;
+$$;
+
+-- ── MIGRATION LOG ───────────────────────────────────────────────
+INSERT INTO schema_migrations (version, description)
+VALUES ('005', 'price_history partitioned by month on scraped_at')
+ON CONFLICT (version) DO NOTHING;
+
+COMMIT;
@@ -15,6 +15,7 @@ Environment variables:
   AWS_REGION          AWS region for Secrets Manager (default: eu-central-1)
 """
 
+import heapq
 import json
 import logging
 import os
@@ -34,22 +35,21 @@ _COOLDOWN_SECONDS = 300
 
 
 class _ProxyEntry:
-    """Internal tracking for a single proxy endpoint."""
+    """Internal tracking for a single proxy endpoint.
 
-    __slots__ = ("url", "successes", "failures", "last_failure_at")
+    ``score`` is kept up to date by the record_* methods so selection reads
+    a plain attribute instead of recomputing the ratio on every request.
+    """
+
+    __slots__ = ("url", "masked", "successes", "failures", "last_failure_at", "score")
 
     def __init__(self, url: str):
         self.url = url
+        self.masked = _mask_url(url)  # Credential-free form for logs/stats
         self.successes: int = 0
         self.failures: int = 0
         self.last_failure_at: float = 0.0
-
-    @property
-    def score(self) -> float:
-        total = self.successes + self.failures
-        if total == 0:
-            return 1.0  # Untested proxies get full score
-        return self.successes / total
+        self.score: float = 1.0  # Untested proxies get full score
 
     @property
     def is_cooled_down(self) -> bool:
@@ -59,10 +59,12 @@ class _ProxyEntry:
 
     def record_success(self):
         self.successes += 1
+        self.score = self.successes / (self.successes + self.failures)
 
     def record_failure(self):
         self.failures += 1
         self.last_failure_at = time.time()
+        self.score = self.successes / (self.successes + self.failures)
 
 
 class StealthProxyManager:
@@ -110,9 +112,31 @@ class StealthProxyManager:
         '"Linux"',
     ]
 
+    # Static part of every request's headers; copied, then rotated fields set
+    _BASE_HEADERS = {
+        "User-Agent": "",
+        "Accept": "",
+        "Accept-Language": "",
+        "Accept-Encoding": "gzip, deflate, br",
+        "DNT": "1",
+        "Connection": "keep-alive",
+        "Upgrade-Insecure-Requests": "1",
+        "Sec-Fetch-Dest": "document",
+        "Sec-Fetch-Mode": "navigate",
+        "Sec-Fetch-Site": "none",
+        "Sec-Fetch-User": "?1",
+        "Cache-Control": "max-age=0",
+    }
+
     def __init__(self, use_aws_secrets: bool = True):
         self._proxies: list[_ProxyEntry] = []
         self._url_to_entry: dict[str, _ProxyEntry] = {}
+        # Selection state, maintained incrementally by the report_* methods:
+        # proxies out of cooldown, the subset of those above the health
+        # threshold, and a heap of (cooldown_ends_at, url) for the rest.
+        self._available: dict[str, _ProxyEntry] = {}
+        self._healthy: dict[str, _ProxyEntry] = {}
+        self._cooldown_heap: list[tuple[float, str]] = []
 
         # Load proxies from env first
         self._load_env_proxies()
@@ -186,6 +210,21 @@ class StealthProxyManager:
             entry = _ProxyEntry(url)
             self._proxies.append(entry)
             self._url_to_entry[url] = entry
+            self._available[url] = entry
+            self._healthy[url] = entry
+
+    def _release_cooled(self):
+        """Move proxies whose cooldown has expired back into rotation."""
+        now = time.time()
+        heap = self._cooldown_heap
+        while heap and heap[0][0] <= now:
+            ends_at, url = heapq.heappop(heap)
+            entry = self._url_to_entry[url]
+            if ends_at != entry.last_failure_at + _COOLDOWN_SECONDS:
+                continue  # Superseded by a later failure still in the heap
+            self._available[url] = entry
+            if entry.score >= _MIN_HEALTH_SCORE:
+                self._healthy[url] = entry
 
     # ── Public API ────────────────────────────────────────────────
 
@@ -196,29 +235,19 @@ class StealthProxyManager:
         headers to reduce fingerprinting detection.
         """
         ua = get_random_user_agent()
-        platform = random.choice(self._PLATFORMS)
-        mobile = "?0"
-
-        headers = {
-            "User-Agent": ua,
-            "Accept": random.choice(self._ACCEPT_HEADERS),
-            "Accept-Language": random.choice(self._ACCEPT_LANG),
-            "Accept-Encoding": "gzip, deflate, br",
-            "DNT": "1",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "none",
-            "Sec-Fetch-User": "?1",
-            "Cache-Control": "max-age=0",
-        }
+        # One RNG draw drives every rotating header
+        r = random.getrandbits(24)
+
+        headers = self._BASE_HEADERS.copy()
+        headers["User-Agent"] = ua
+        headers["Accept"] = self._ACCEPT_HEADERS[(r & 0x3F) % len(self._ACCEPT_HEADERS)]
+        headers["Accept-Language"] = self._ACCEPT_LANG[((r >> 6) & 0x3F) % len(self._ACCEPT_LANG)]
 
         # Only add Sec-CH-UA for Chrome-like UAs
         if "Chrome" in ua:
-            headers["Sec-CH-UA"] = random.choice(self._SEC_CH_UA)
-            headers["Sec-CH-UA-Mobile"] = mobile
-            headers["Sec-CH-UA-Platform"] = platform
+            headers["Sec-CH-UA"] = self._SEC_CH_UA[((r >> 12) & 0x3F) % len(self._SEC_CH_UA)]
+            headers["Sec-CH-UA-Mobile"] = "?0"
+            headers["Sec-CH-UA-Platform"] = self._PLATFORMS[(r >> 18) % len(self._PLATFORMS)]
 
         return headers
 
@@ -228,14 +257,12 @@ class StealthProxyManager:
         Returns None if no proxies are configured or all are unhealthy.
         Selects based on weighted random using health scores.
         """
-        candidates = [
-            p for p in self._proxies
-            if p.score >= _MIN_HEALTH_SCORE and p.is_cooled_down
-        ]
+        self._release_cooled()
+        candidates = list(self._healthy.values())
 
         if not candidates:
-            # If all proxies are in cooldown, try any that have cooled down
-            candidates = [p for p in self._proxies if p.is_cooled_down]
+            # If no proxy is healthy, try any that have cooled down
+            candidates = list(self._available.values())
 
         if not candidates:
             return None
@@ -260,15 +287,23 @@ class StealthProxyManager:
         entry = self._url_to_entry.get(proxy_url)
         if entry:
             entry.record_success()
+            if entry.score >= _MIN_HEALTH_SCORE and proxy_url in self._available:
+                self._healthy[proxy_url] = entry
 
     def report_failure(self, proxy_url: str):
         """Report a failed request through a proxy."""
         entry = self._url_to_entry.get(proxy_url)
         if entry:
             entry.record_failure()
+            self._available.pop(proxy_url, None)
+            self._healthy.pop(proxy_url, None)
+            heapq.heappush(
+                self._cooldown_heap,
+                (entry.last_failure_at + _COOLDOWN_SECONDS, proxy_url),
+            )
             if entry.score < _MIN_HEALTH_SCORE:
                 logger.warning(
-                    f"Proxy {_mask_url(proxy_url)} health dropped to "
+                    f"Proxy {entry.masked} health dropped to "
                     f"{entry.score:.0%}, entering cooldown"
                 )
 
@@ -280,10 +315,8 @@ class StealthProxyManager:
     @property
     def healthy_count(self) -> int:
         """Number of proxies above minimum health threshold."""
-        return sum(
-            1 for p in self._proxies
-            if p.score >= _MIN_HEALTH_SCORE and p.is_cooled_down
-        )
+        self._release_cooled()
+        return len(self._healthy)
 
     def get_pool_stats(self) -> dict:
         """Return pool health statistics for monitoring."""
@@ -292,7 +325,7 @@ class StealthProxyManager:
             "healthy": self.healthy_count,
             "proxies": [
                 {
-                    "url": _mask_url(p.url),
+                    "url": p.masked,
                     "score": round(p.score, 2),
                     "successes": p.successes,
                     "failures": p.failures,
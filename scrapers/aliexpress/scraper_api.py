@@ -30,7 +30,8 @@ import logging
 import os
 import re
 import sys
-from datetime import datetime
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 from urllib.parse import urlencode, urljoin, urlparse
 
@@ -38,7 +39,7 @@ from bs4 import BeautifulSoup
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
-from scrapers.common.base import BaseScraper
+from scrapers.common.base import BaseScraper, run_async
 from scrapers.common.models import Category, PricePoint, Product, ScraperResult, Source
 
 logging.basicConfig(
@@ -223,7 +224,8 @@ class AliExpressScraper(BaseScraper):
 
     async def scrape(self) -> ScraperResult:
         """Override to use _fetch_js for AliExpress JS-rendered pages."""
-        started_at = datetime.utcnow()
+        started_at = datetime.now(timezone.utc)
+        started = time.monotonic()
         products: list[Product] = []
         errors: list[str] = []
         total_pages = 0
@@ -276,7 +278,7 @@ class AliExpressScraper(BaseScraper):
                 except Exception as e:
                     errors.append(f"Product parse error ({url}): {e}")
 
-        finished_at = datetime.utcnow()
+        finished_at = started_at + timedelta(seconds=time.monotonic() - started)
         result = ScraperResult(
             source=self.source,
             products=products,
@@ -791,7 +793,7 @@ Examples:
     args = parser.parse_args()
 
     brands = [b.strip() for b in args.brand.split(",")] if args.brand else None
-    asyncio.run(
+    run_async(
         run(
             args.pages,
             args.output,
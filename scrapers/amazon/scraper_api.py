@@ -10,25 +10,42 @@ detection and requires JS rendering for complete product data.
 Usage:
     python scrapers/amazon/scraper_api.py --pages 2 --output data/amazon_intelligence.json
     python scrapers/amazon/scraper_api.py --pages 1 --category skincare_serums
+    python scrapers/amazon/scraper_api.py --pages 2 --skip-seen-hours 24
 """
 
 import argparse
 import asyncio
+import functools
 import hashlib
 import json
 import logging
 import os
 import re
+import sqlite3
 import sys
-from datetime import datetime
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Optional
-from urllib.parse import urljoin, urlparse, parse_qs, urlencode
 
-from bs4 import BeautifulSoup
+import soupsieve as sv
+import orjson
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401  -- C-backed tree builder, much faster on large pages
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html.parser"
+
+try:
+    # Lexbor-backed parser for the link harvest on search pages
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
-from scrapers.common.base import BaseScraper
+from scrapers.common.base import BaseScraper, run_async
 from scrapers.common.models import Product, PricePoint, ScraperResult, Source, Category
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
@@ -49,6 +66,105 @@ CATEGORY_MAP = {
     "nail_care": ("/s?k=nagellack+nagelpflege&rh=n%3A84249031", Category.NAIL_CARE),
 }
 
+# Patterns used once or more per product, compiled at import
+_BRAND_PREFIX = re.compile(r"^(Marke:|Brand:|Besuche den |Visit the )\s*")
+_BRAND_SUFFIX = re.compile(r"\s*-?Store$")
+_RATING_RE = re.compile(r"([\d,]+)\s*(?:von|out of)\s*5")
+_REVIEW_COUNT_RE = re.compile(r"([\d.]+)")
+_SIZE_RE = re.compile(r"(\d+\s*(?:ml|g|oz|fl))", re.I)
+_PRICE_CLEAN = re.compile(r"[^\d,.]")
+_INGREDIENTS_HDR = re.compile(r"inhaltsstoffe|ingredients", re.I)
+_ASIN_RE = re.compile(r"/dp/([A-Z0-9]{10})")
+
+# Keyword -> category, in priority order (first matching category wins)
+_CATEGORY_KEYWORDS = {
+    "serum": Category.SERUMS,
+    "creme": Category.MOISTURIZERS,
+    "moisturiz": Category.MOISTURIZERS,
+    "feuchtigk": Category.MOISTURIZERS,
+    "toner": Category.TONERS,
+    "gesichtswasser": Category.TONERS,
+    "maske": Category.FACE_MASKS,
+    "mask": Category.FACE_MASKS,
+    "parfum": Category.FRAGRANCES,
+    "fragrance": Category.FRAGRANCES,
+    "eau de": Category.FRAGRANCES,
+    "shampoo": Category.SHAMPOO_CONDITIONER,
+    "conditioner": Category.SHAMPOO_CONDITIONER,
+    "haar": Category.HAIRCARE,
+    "hair": Category.HAIRCARE,
+    "nagel": Category.NAIL_CARE,
+    "nail": Category.NAIL_CARE,
+}
+_CATEGORY_RANK = {c: i for i, c in enumerate(dict.fromkeys(_CATEGORY_KEYWORDS.values()))}
+
+_ACTIVE_KEYWORDS = {
+    "niacinamide": "niacinamide",
+    "retinol": "retinol",
+    "hyaluronic acid": "hyaluronic_acid",
+    "hyaluronsäure": "hyaluronic_acid",
+    "salicylic acid": "salicylic_acid",
+    "salicylsäure": "salicylic_acid",
+    "glycolic acid": "glycolic_acid",
+    "lactic acid": "lactic_acid",
+    "vitamin c": "vitamin_c",
+    "ascorbic acid": "vitamin_c",
+    "ascorbinsäure": "vitamin_c",
+    "azelaic acid": "azelaic_acid",
+    "ceramide": "ceramide",
+    "peptide": "peptide",
+    "squalane": "squalane",
+    "centella": "centella",
+    "bakuchiol": "bakuchiol",
+    "zink": "zinc",
+}
+_NOTABLE_KEYWORDS = ("fragrance", "alcohol denat", "parfum", "duftstoff")
+
+
+def _keyword_scanner(keywords) -> re.Pattern:
+    """One pattern reporting every keyword occurrence, overlaps included.
+
+    The lookahead makes each match zero-width, so a single finditer pass
+    over the text yields the same hits as one `in` check per keyword. At a
+    given position only the longest keyword is reported, which is fine as
+    long as keywords sharing a prefix ("mask"/"maske") map to the same value.
+    """
+    alternation = "|".join(re.escape(k) for k in sorted(keywords, key=len, reverse=True))
+    return re.compile(f"(?=({alternation}))")
+
+
+_CATEGORY_SCAN = _keyword_scanner(_CATEGORY_KEYWORDS)
+_INGREDIENT_SCAN = _keyword_scanner({*_ACTIVE_KEYWORDS, *_NOTABLE_KEYWORDS})
+
+# Only these parts of a page are ever read, so the parser is told to skip
+# building the rest of Amazon's (very large) DOM.
+_LISTING_STRAINER = SoupStrainer("a", href=re.compile(r"/dp/"))
+_PRODUCT_STRAINER = SoupStrainer(id=re.compile(
+    r"^(?:ppd"  # Title, byline, price, images, rating, availability, overview
+    r"|productDescription"
+    r"|productDetails_\w+"  # Tech spec / detail tables (ingredients, size)
+    r"|detailBullets\w*"
+    r"|important-information"
+    r"|aplus)$"
+))
+
+# Elements parse_product reads, indexed by _collect() in one walk
+_PRODUCT_IDS = frozenset({
+    "productTitle", "bylineInfo", "priceblock_ourprice", "priceblock_dealprice",
+    "imgTagWrapperId", "landingImage", "main-image", "productDescription",
+    "feature-bullets", "acrPopover", "acrCustomerReviewText", "availability",
+    "important-information",
+})
+_PRODUCT_CLASSES = frozenset({
+    "a-price", "a-price-whole", "priceBlockStrikePriceString", "po-brand", "a-icon-star",
+    "product-title-word-break",
+})
+
+# Compound selectors scanned lazily with iselect (first hit usually wins)
+_DETAIL_ROWS = sv.compile("#productDetails_techSpec_section_1 tr, .content-grid-block tr")
+_SIZE_ROWS = sv.compile(".po-size .po-break-word, #productDetails_techSpec_section_1 tr")
+_OTHER_DETAIL_ROWS = sv.compile("[id^='productDetails_'] tr, [id^='detailBullets'] tr")
+
 DEFAULT_CATEGORIES = [
     "skincare_serums",
     "skincare_moisturizers",
@@ -64,6 +180,8 @@ class AmazonScraper(BaseScraper):
         self,
         pages_per_category: int = 2,
         category_filter: Optional[str] = None,
+        seen_cache: Optional["_SeenAsinCache"] = None,
+        skip_seen_hours: float = 0,
         **kwargs,
     ):
         super().__init__(
@@ -81,6 +199,9 @@ class AmazonScraper(BaseScraper):
             if category_filter and category_filter in CATEGORY_MAP
             else {k: CATEGORY_MAP[k] for k in DEFAULT_CATEGORIES}
         )
+        # Incremental runs: ASINs scraped within skip_seen_hours are not refetched
+        self.seen_cache = seen_cache
+        self.skip_seen_hours = skip_seen_hours
 
     async def get_category_urls(self) -> list[str]:
         """Generate paginated Amazon search result URLs."""
@@ -94,88 +215,76 @@ class AmazonScraper(BaseScraper):
 
     async def parse_listing(self, html: str, url: str) -> list[str]:
         """Extract product detail page URLs from Amazon search results."""
-        soup = BeautifulSoup(html, "html.parser")
+        # Search result links carry a-link-normal; any /dp/ link is the fallback
+        if LexborHTMLParser is not None:
+            tree = LexborHTMLParser(html)
+            links = tree.css("a.a-link-normal[href*='/dp/']") or tree.css("a[href*='/dp/']")
+            hrefs = [link.attributes.get("href") for link in links]
+        else:
+            # Only <a href*="/dp/"> elements are built
+            soup = BeautifulSoup(html, _HTML_PARSER, parse_only=_LISTING_STRAINER)
+            links = soup.find_all("a", class_="a-link-normal") or soup.find_all("a")
+            hrefs = [link.get("href") for link in links]
+
         product_urls = []
         seen = set()
-
-        # Amazon search result selectors
-        selectors = [
-            "div[data-component-type='s-search-result'] a.a-link-normal[href*='/dp/']",
-            ".s-result-item a.a-link-normal[href*='/dp/']",
-            "h2 a.a-link-normal[href*='/dp/']",
-            "a[href*='/dp/'][class*='a-link-normal']",
-        ]
-
-        for selector in selectors:
-            links = soup.select(selector)
-            for link in links:
-                href = link.get("href", "")
-                if not href:
-                    continue
-                full_url = urljoin(BASE_URL, href)
-                # Clean URL to just the product page (remove tracking params)
-                clean_url = _clean_amazon_url(full_url)
-                if clean_url and clean_url not in seen:
+        for href in hrefs:
+            # The ASIN alone identifies the product page: read it straight
+            # from the (relative or absolute) href, dropping tracking params
+            if href and (m := _ASIN_RE.search(href)):
+                clean_url = f"{BASE_URL}/dp/{m.group(1)}"
+                if clean_url not in seen:
                     seen.add(clean_url)
                     product_urls.append(clean_url)
 
-        # Fallback: find any /dp/ links
-        if not product_urls:
-            for a in soup.find_all("a", href=True):
-                href = a["href"]
-                if "/dp/" in href:
-                    full_url = urljoin(BASE_URL, href)
-                    clean_url = _clean_amazon_url(full_url)
-                    if clean_url and clean_url not in seen:
-                        seen.add(clean_url)
-                        product_urls.append(clean_url)
-
         logger.info(f"[amazon] Found {len(product_urls)} product links on {url}")
         return product_urls
 
     async def parse_product(self, html: str, url: str) -> Optional[Product]:
         """Parse an Amazon product detail page into a Product model."""
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, _HTML_PARSER, parse_only=_PRODUCT_STRAINER)
 
         try:
+            # One walk over the tree indexes every element read below
+            nodes = _collect(soup)
+
             # Product name
-            name_el = (
-                soup.select_one("#productTitle")
-                or soup.select_one("h1.product-title-word-break")
-                or soup.select_one("h1 span")
-            )
+            if not (name_el := _find_title(nodes)):
+                # Unfamiliar layout without the usual sections: parse it all
+                soup = BeautifulSoup(html, _HTML_PARSER)
+                nodes = _collect(soup)
+                name_el = _find_title(nodes)
             name = name_el.get_text(strip=True) if name_el else None
             if not name:
                 return None
 
             # Brand
             brand_el = (
-                soup.select_one("#bylineInfo")
-                or soup.select_one("a#bylineInfo")
-                or soup.select_one(".po-brand .po-break-word")
+                _first(nodes, "bylineInfo")
+                or _inside(nodes, "po-brand", class_="po-break-word")
             )
             brand = "Unknown"
             if brand_el:
                 brand_text = brand_el.get_text(strip=True)
                 # Remove "Marke: " or "Brand: " prefix
-                brand = re.sub(r"^(Marke:|Brand:|Besuche den |Visit the )\s*", "", brand_text).strip()
+                brand = _BRAND_PREFIX.sub("", brand_text).strip()
                 # Remove "-Store" suffix
-                brand = re.sub(r"\s*-?Store$", "", brand).strip()
+                brand = _BRAND_SUFFIX.sub("", brand).strip()
 
             # Price
             price_el = (
-                soup.select_one(".a-price .a-offscreen")
-                or soup.select_one("#priceblock_ourprice")
-                or soup.select_one("#priceblock_dealprice")
-                or soup.select_one(".a-price-whole")
+                _inside(nodes, "a-price", class_="a-offscreen")
+                or _first(nodes, "priceblock_ourprice")
+                or _first(nodes, "priceblock_dealprice")
+                or _first(nodes, "a-price-whole")
             )
             price_text = price_el.get_text(strip=True) if price_el else "0"
             price_val = _extract_price(price_text)
 
             # Original price (if on sale)
             original_el = (
-                soup.select_one(".a-price[data-a-strike='true'] .a-offscreen")
-                or soup.select_one(".priceBlockStrikePriceString")
+                _inside(nodes, "a-price-strike", class_="a-offscreen")
+                or _first(nodes, "priceBlockStrikePriceString")
             )
             sale_price = None
             if original_el:
@@ -186,9 +295,9 @@ class AmazonScraper(BaseScraper):
 
             # Image
             img_el = (
-                soup.select_one("#imgTagWrapperId img")
-                or soup.select_one("#landingImage")
-                or soup.select_one("#main-image")
+                _inside(nodes, "imgTagWrapperId", "img")
+                or _first(nodes, "landingImage")
+                or _first(nodes, "main-image")
             )
             image_url = None
             if img_el:
@@ -207,54 +316,44 @@ class AmazonScraper(BaseScraper):
                         image_url = None
 
             # Description
-            desc_el = (
-                soup.select_one("#productDescription")
-                or soup.select_one("#feature-bullets")
-            )
+            desc_el = _first(nodes, "productDescription") or _first(nodes, "feature-bullets")
             description = desc_el.get_text(strip=True)[:1000] if desc_el else None
 
             # Rating
-            rating_el = soup.select_one("#acrPopover") or soup.select_one(".a-icon-star span")
+            rating_el = _first(nodes, "acrPopover") or _inside(nodes, "a-icon-star", "span")
             rating = None
             if rating_el:
                 rating_text = rating_el.get("title", "") or rating_el.get_text(strip=True)
-                rating_match = re.search(r"([\d,]+)\s*(?:von|out of)\s*5", rating_text)
-                if rating_match:
+                if rating_match := _RATING_RE.search(rating_text):
                     rating = min(float(rating_match.group(1).replace(",", ".")), 5.0)
 
             # Review count
-            review_el = soup.select_one("#acrCustomerReviewText")
+            review_el = _first(nodes, "acrCustomerReviewText")
             review_count = None
             if review_el:
-                count_match = re.search(r"([\d.]+)", review_el.get_text().replace(".", ""))
-                if count_match:
+                if count_match := _REVIEW_COUNT_RE.search(review_el.get_text().replace(".", "")):
                     review_count = int(count_match.group(1))
 
             # Ingredients
-            ingredients = None
             # Check product details table
-            for row in soup.select("#productDetails_techSpec_section_1 tr, .content-grid-block tr"):
-                header = row.select_one("th, td:first-child")
-                if header and re.search(r"inhaltsstoffe|ingredients", header.get_text(), re.I):
-                    value = row.select_one("td:last-child, td:nth-child(2)")
-                    if value:
-                        ingredients = value.get_text(strip=True)[:2000]
-                        break
+            ingredients = _ingredients_from_rows(_DETAIL_ROWS.iselect(soup))
 
             # Also check "Important information" section
             if not ingredients:
-                important_el = soup.select_one("#important-information .content")
+                important_el = _inside(nodes, "important-information", class_="content")
                 if important_el:
                     text = important_el.get_text(strip=True)
                     if len(text) > 50:  # Likely ingredients list
                         ingredients = text[:2000]
 
+            # Finally the other product detail tables
+            if not ingredients:
+                ingredients = _ingredients_from_rows(_OTHER_DETAIL_ROWS.iselect(soup))
+
             # Size
             size = None
-            for row in soup.select(".po-size .po-break-word, #productDetails_techSpec_section_1 tr"):
-                text = row.get_text(strip=True)
-                size_match = re.search(r"(\d+\s*(?:ml|g|oz|fl))", text, re.I)
-                if size_match:
+            for row in _SIZE_ROWS.iselect(soup):
+                if size_match := _SIZE_RE.search(row.get_text(strip=True)):
                     size = size_match.group(1)
                     break
 
@@ -263,7 +362,7 @@ class AmazonScraper(BaseScraper):
             external_id = f"amazon_{asin}" if asin else hashlib.md5(url.encode()).hexdigest()[:16]
 
             # Availability
-            avail_el = soup.select_one("#availability span")
+            avail_el = _inside(nodes, "availability", "span")
             in_stock = True
             if avail_el:
                 avail_text = avail_el.get_text(strip=True).lower()
@@ -301,8 +400,15 @@ class AmazonScraper(BaseScraper):
             return None
 
     async def scrape(self) -> ScraperResult:
-        """Override to use _fetch_js for Amazon's JS-heavy pages."""
-        started_at = datetime.utcnow()
+        """Override to use _fetch_js for Amazon's JS-heavy pages.
+
+        Listing and product pages are pipelined: product URLs are queued as
+        soon as their search page is parsed, and product workers start on
+        them while the remaining search pages are still loading. One
+        semaphore bounds all in-flight page loads at max_concurrent.
+        """
+        started_at = datetime.now(timezone.utc)
+        started = time.monotonic()
         products: list[Product] = []
         errors: list[str] = []
         total_pages = 0
@@ -310,30 +416,55 @@ class AmazonScraper(BaseScraper):
         logger.info(f"[{self.source.value}] Starting scrape (JS mode)...")
 
         category_urls = await self.get_category_urls()
-        product_urls: list[str] = []
-
-        # Phase 1: Collect product URLs from search result pages
-        for cat_url in category_urls:
-            html = await self._fetch_js(
-                cat_url,
-                wait_selector=".s-result-item, [data-component-type='s-search-result']",
-            )
-            if html:
-                total_pages += 1
+        queue: asyncio.Queue = asyncio.Queue()
+        sem = asyncio.Semaphore(self.max_concurrent)
+        seen: set[str] = set()  # Product URLs already queued
+        skip_seen = self.seen_cache is not None and self.skip_seen_hours > 0
+        skipped = 0
+
+        # Phase 1 (producers): search result pages -> product URLs
+        async def crawl_listing(cat_url: str):
+            nonlocal total_pages, skipped
+            try:
+                async with sem:
+                    html = await self._fetch_js(
+                        cat_url,
+                        wait_selector=".s-result-item, [data-component-type='s-search-result']",
+                    )
+            except Exception as e:
+                errors.append(f"Listing fetch error ({cat_url}): {e}")
+                return
+            if not html:
+                return
+            total_pages += 1
+            try:
+                urls = [u for u in await self.parse_listing(html, cat_url) if u not in seen]
+            except Exception as e:
+                errors.append(f"Listing parse error ({cat_url}): {e}")
+                return
+            if skip_seen:
+                fresh = self.seen_cache.fresh(
+                    [_extract_asin(u) for u in urls], self.skip_seen_hours * 3600
+                )
+                skipped += sum(1 for u in urls if _extract_asin(u) in fresh)
+                urls = [u for u in urls if _extract_asin(u) not in fresh]
+            for u in urls:
+                if u not in seen:
+                    seen.add(u)
+                    queue.put_nowait(u)
+
+        # Phase 2 (consumers): product pages, started while listings load
+        async def scrape_products():
+            nonlocal total_pages
+            while (url := await queue.get()) is not None:
                 try:
-                    urls = await self.parse_listing(html, cat_url)
-                    product_urls.extend(urls)
+                    async with sem:
+                        html = await self._fetch_js(url, wait_selector="#productTitle, #dp")
                 except Exception as e:
-                    errors.append(f"Listing parse error ({cat_url}): {e}")
-
-        # Deduplicate
-        product_urls = list(set(product_urls))
-        logger.info(f"[{self.source.value}] Found {len(product_urls)} unique product URLs")
-
-        # Phase 2: Scrape individual product pages
-        for url in product_urls:
-            html = await self._fetch_js(url, wait_selector="#productTitle, #dp")
-            if html:
+                    errors.append(f"Product fetch error ({url}): {e}")
+                    continue
+                if not html:
+                    continue
                 total_pages += 1
                 try:
                     product = await self.parse_product(html, url)
@@ -342,7 +473,26 @@ class AmazonScraper(BaseScraper):
                 except Exception as e:
                     errors.append(f"Product parse error ({url}): {e}")
 
-        finished_at = datetime.utcnow()
+        workers = [asyncio.create_task(scrape_products()) for _ in range(self.max_concurrent)]
+        try:
+            await asyncio.gather(*(crawl_listing(u) for u in category_urls))
+            logger.info(f"[{self.source.value}] Found {len(seen)} unique product URLs")
+            if skipped:
+                logger.info(
+                    f"[{self.source.value}] Skipped {skipped} products scraped in the "
+                    f"last {self.skip_seen_hours:g}h"
+                )
+            for _ in workers:
+                queue.put_nowait(None)  # One stop marker per worker
+            await asyncio.gather(*workers)
+        finally:
+            for w in workers:
+                w.cancel()
+
+        if self.seen_cache:
+            self.seen_cache.mark([p.sku for p in products if p.sku])
+
+        finished_at = started_at + timedelta(seconds=time.monotonic() - started)
         result = ScraperResult(
             source=self.source,
             products=products,
@@ -361,24 +511,96 @@ class AmazonScraper(BaseScraper):
 
 # ── Helpers ──────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=2048)
 def _extract_price(text: str) -> float:
-    """Extract numeric price from text like '29,90 EUR' or '29.90'."""
+    """Extract numeric price from text like '29,90 EUR', '1.299,00 €' or '29.90'.
+
+    The last '.' or ',' is the decimal point when at most two digits follow
+    it; otherwise ('1.299 €') every separator is a thousands separator.
+    Price strings repeat heavily across a run, hence the cache.
+    """
     if not text:
         return 0.0
-    cleaned = re.sub(r"[^\d,.]", "", text)
-    cleaned = cleaned.replace(",", ".")
-    parts = cleaned.rsplit(".", 1)
-    if len(parts) == 2:
-        cleaned = parts[0].replace(".", "") + "." + parts[1]
+    cleaned = _PRICE_CLEAN.sub("", text)
+    sep = max(cleaned.rfind("."), cleaned.rfind(","))
+    if sep == -1:
+        whole, frac = cleaned, ""
+    elif len(cleaned) - sep - 1 <= 2:
+        whole, frac = cleaned[:sep], cleaned[sep + 1:]
+    else:
+        whole, frac = cleaned, ""
+    whole = whole.replace(".", "").replace(",", "")
     try:
-        return float(cleaned)
+        return float(f"{whole}.{frac}" if frac else whole)
     except ValueError:
         return 0.0
 
 
+def _collect(soup) -> dict:
+    """Index the elements parse_product reads, in a single tree walk.
+
+    Maps each wanted id (_PRODUCT_IDS) and class (_PRODUCT_CLASSES) to its
+    elements in document order. Extra keys: "a-price-strike" for the
+    struck-through .a-price elements, "h1" for the <h1> elements.
+    """
+    nodes = {}
+    for tag in soup.find_all(True):
+        tag_id = tag.get("id")
+        if tag_id in _PRODUCT_IDS:
+            nodes.setdefault(tag_id, []).append(tag)
+        classes = tag.get("class", ())
+        for cls in classes:
+            if cls in _PRODUCT_CLASSES:
+                nodes.setdefault(cls, []).append(tag)
+        if tag.name == "h1":
+            nodes.setdefault("h1", []).append(tag)
+        if "a-price" in classes and tag.get("data-a-strike") == "true":
+            nodes.setdefault("a-price-strike", []).append(tag)
+    return nodes
+
+
+def _first(nodes: dict, key: str):
+    """First element indexed under `key`, if any."""
+    found = nodes.get(key)
+    return found[0] if found else None
+
+
+def _inside(nodes: dict, key: str, *args, **kwargs):
+    """First descendant matching find(*args, **kwargs) under any nodes[key].
+
+    Same result as select_one("<key> <descendant>"): a parent without a
+    match (an empty savings .a-price, say) doesn't hide later ones.
+    """
+    for parent in nodes.get(key, ()):
+        if (found := parent.find(*args, **kwargs)) is not None:
+            return found
+    return None
+
+
+def _find_title(nodes: dict):
+    """Product title element; fallbacks are only consulted when needed."""
+    if title := _first(nodes, "productTitle"):
+        return title
+    if (title := _first(nodes, "product-title-word-break")) is not None and title.name == "h1":
+        return title
+    return _inside(nodes, "h1", "span")
+
+
+def _ingredients_from_rows(rows) -> Optional[str]:
+    """Value of the first table row whose header names the ingredients."""
+    for row in rows:
+        header = row.find(("th", "td"))  # First cell
+        if header and _INGREDIENTS_HDR.search(header.get_text()):
+            value = row.select_one("td:last-child, td:nth-child(2)")
+            if value:
+                return value.get_text(strip=True)[:2000]
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
 def _extract_asin(url: str) -> Optional[str]:
     """Extract ASIN from Amazon URL (the /dp/ASIN part)."""
-    match = re.search(r"/dp/([A-Z0-9]{10})", url)
+    match = _ASIN_RE.search(url)
     return match.group(1) if match else None
 
 
@@ -393,47 +615,90 @@ def _clean_amazon_url(url: str) -> Optional[str]:
 def _url_to_category(url: str, name: str = "") -> Category:
     """Determine product category from URL and product name context."""
     combined = (url + " " + name).lower()
-    if "serum" in combined:
-        return Category.SERUMS
-    if "creme" in combined or "moisturiz" in combined or "feuchtigk" in combined:
-        return Category.MOISTURIZERS
-    if "toner" in combined or "gesichtswasser" in combined:
-        return Category.TONERS
-    if "maske" in combined or "mask" in combined:
-        return Category.FACE_MASKS
-    if "parfum" in combined or "fragrance" in combined or "eau de" in combined:
-        return Category.FRAGRANCES
-    if "shampoo" in combined or "conditioner" in combined:
-        return Category.SHAMPOO_CONDITIONER
-    if "haar" in combined or "hair" in combined:
-        return Category.HAIRCARE
-    if "nagel" in combined or "nail" in combined:
-        return Category.NAIL_CARE
-    return Category.SKINCARE
+    # One scan for every keyword; the earliest-listed category that hit wins
+    hits = {m.group(1) for m in _CATEGORY_SCAN.finditer(combined)}
+    if not hits:
+        return Category.SKINCARE
+    return min((_CATEGORY_KEYWORDS[k] for k in hits), key=_CATEGORY_RANK.__getitem__)
+
+
+@functools.lru_cache(maxsize=4096)
+def _product_hash(source: str, external_id: str, name: str) -> str:
+    """Stable anonymised id; shared by the anonymised and staging outputs."""
+    return hashlib.sha256(f"{source}:{external_id}:{name}".encode()).hexdigest()[:16]
+
+
+# ASINs per lookup, below SQLite's 999 bound-parameter floor (one is the cutoff)
+_SQLITE_MAX_PARAMS = 900
+
+
+class _SeenAsinCache:
+    """On-disk record of when each ASIN was last scraped (SQLite).
+
+    Lets incremental runs skip product pages fetched recently; the listing
+    pages are still crawled so new products are picked up.
+    """
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen (asin TEXT PRIMARY KEY, scraped_at REAL NOT NULL)"
+        )
+
+    def fresh(self, asins: list, ttl_seconds: float) -> set:
+        """The subset of `asins` scraped within the last `ttl_seconds`."""
+        asins = list({a for a in asins if a})
+        cutoff = time.time() - ttl_seconds
+        fresh = set()
+        # Only the candidates are looked up, in chunks under SQLite's
+        # bound-parameter limit
+        for i in range(0, len(asins), _SQLITE_MAX_PARAMS):
+            chunk = asins[i:i + _SQLITE_MAX_PARAMS]
+            rows = self._conn.execute(
+                f"SELECT asin FROM seen WHERE asin IN ({','.join('?' * len(chunk))}) "
+                "AND scraped_at >= ?",
+                (*chunk, cutoff),
+            )
+            fresh.update(asin for (asin,) in rows)
+        return fresh
+
+    def mark(self, asins: list):
+        """Record `asins` as scraped now."""
+        now = time.time()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO seen (asin, scraped_at) VALUES (?, ?) "
+                "ON CONFLICT (asin) DO UPDATE SET scraped_at = excluded.scraped_at",
+                ((a, now) for a in asins),
+            )
+
+    def close(self):
+        self._conn.close()
+
+
+# EUR price tiers: (exclusive lower bound, tier), highest first
+_PRICE_TIERS = ((100, "luxury"), (50, "premium"), (15, "mid"))
+# Dermatologist brands rated mid_range regardless of price
+_PREMIUM_BRANDS = frozenset({"la roche-posay", "vichy", "cerave", "neutrogena", "paula's choice"})
+
+
+def _price_tier(price: float) -> str:
+    """EUR price tier for a product price."""
+    return next((tier for bound, tier in _PRICE_TIERS if price > bound), "budget")
 
 
 def _anonymise_product(product: Product) -> dict:
     """Convert a Product to an anonymised intelligence dict."""
-    hash_input = f"{product.source.value}:{product.external_id}:{product.name}"
-    product_hash = hashlib.sha256(hash_input.encode()).hexdigest()[:16]
+    product_hash = _product_hash(product.source.value, product.external_id, product.name)
 
-    # EUR price tiers
     price = product.price.price
-    if price > 100:
-        price_tier = "luxury"
-    elif price > 50:
-        price_tier = "premium"
-    elif price > 15:
-        price_tier = "mid"
-    else:
-        price_tier = "budget"
+    price_tier = _price_tier(price)
 
     # Brand tier
-    premium_brands = {"la roche-posay", "vichy", "cerave", "neutrogena", "paula's choice"}
-    brand_lower = product.brand.lower()
     if price > 80:
         brand_type = "premium"
-    elif brand_lower in premium_brands or price > 30:
+    elif price > 30 or product.brand.lower() in _PREMIUM_BRANDS:
         brand_type = "mid_range"
     else:
         brand_type = "mass_market"
@@ -467,18 +732,10 @@ def _anonymise_product(product: Product) -> dict:
 
 def _full_product_for_staging(product: Product) -> dict:
     """Convert a Product to a full staging dict that preserves ALL data."""
-    hash_input = f"{product.source.value}:{product.external_id}:{product.name}"
-    product_hash = hashlib.sha256(hash_input.encode()).hexdigest()[:16]
+    product_hash = _product_hash(product.source.value, product.external_id, product.name)
 
     price = product.price.price if product.price else 0
-    if price > 100:
-        price_tier = "luxury"
-    elif price > 50:
-        price_tier = "premium"
-    elif price > 15:
-        price_tier = "mid"
-    else:
-        price_tier = "budget"
+    price_tier = _price_tier(price)
 
     return {
         "product_hash": product_hash,
@@ -507,61 +764,61 @@ def _extract_ingredient_profile(ingredients_text: Optional[str]) -> dict:
     if not ingredients_text:
         return {"actives": [], "notable": []}
 
-    text_lower = ingredients_text.lower()
-    actives = []
-    notable = []
-
-    active_keywords = {
-        "niacinamide": "niacinamide",
-        "retinol": "retinol",
-        "hyaluronic acid": "hyaluronic_acid",
-        "hyaluronsäure": "hyaluronic_acid",
-        "salicylic acid": "salicylic_acid",
-        "salicylsäure": "salicylic_acid",
-        "glycolic acid": "glycolic_acid",
-        "lactic acid": "lactic_acid",
-        "vitamin c": "vitamin_c",
-        "ascorbic acid": "vitamin_c",
-        "ascorbinsäure": "vitamin_c",
-        "azelaic acid": "azelaic_acid",
-        "ceramide": "ceramide",
-        "peptide": "peptide",
-        "squalane": "squalane",
-        "centella": "centella",
-        "bakuchiol": "bakuchiol",
-        "zink": "zinc",
-    }
+    hits = {m.group(1) for m in _INGREDIENT_SCAN.finditer(ingredients_text.lower())}
+    actives = list(dict.fromkeys(
+        active_name for keyword, active_name in _ACTIVE_KEYWORDS.items() if keyword in hits
+    ))
+    notable = [keyword.replace(" ", "_") for keyword in _NOTABLE_KEYWORDS if keyword in hits]
 
-    for keyword, active_name in active_keywords.items():
-        if keyword in text_lower:
-            actives.append(active_name)
+    return {"actives": actives, "notable": notable}
 
-    for keyword in ["fragrance", "alcohol denat", "parfum", "duftstoff"]:
-        if keyword in text_lower:
-            notable.append(keyword.replace(" ", "_"))
 
-    return {"actives": actives, "notable": notable}
+def _build_records(products: list) -> tuple:
+    """Anonymised and staging records for `products`, in order."""
+    anonymised, staging = [], []
+    for product in products:
+        anonymised.append(_anonymise_product(product))
+        staging.append(_full_product_for_staging(product))
+    return anonymised, staging
 
 
 # ── CLI entrypoint ───────────────────────────────────────────
 
-async def run(pages: int, output: str, category: Optional[str] = None):
+async def run(
+    pages: int,
+    output: str,
+    category: Optional[str] = None,
+    skip_seen_hours: float = 0,
+):
     """Run the Amazon scraper and write results to JSON."""
-    scraper = AmazonScraper(pages_per_category=pages, category_filter=category)
-    async with scraper:
-        result = await scraper.scrape()
+    # The cache file is only opened for incremental runs
+    seen_cache = (
+        _SeenAsinCache(os.path.join(os.path.dirname(output) or ".", "amazon_seen.sqlite3"))
+        if skip_seen_hours > 0 else None
+    )
+    scraper = AmazonScraper(
+        pages_per_category=pages,
+        category_filter=category,
+        seen_cache=seen_cache,
+        skip_seen_hours=skip_seen_hours,
+    )
+    try:
+        async with scraper:
+            result = await scraper.scrape()
+    finally:
+        if seen_cache:
+            seen_cache.close()
 
-    anonymised = [_anonymise_product(p) for p in result.products]
-    staging = [_full_product_for_staging(p) for p in result.products]
+    anonymised, staging = _build_records(result.products)
 
     os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
-    with open(output, "w") as f:
-        json.dump(anonymised, f, indent=2, ensure_ascii=False)
+    with open(output, "wb") as f:
+        f.write(orjson.dumps(anonymised, option=orjson.OPT_INDENT_2))
 
     # Also write full staging data alongside the anonymised output
     staging_output = output.replace(".json", "_staging.json")
-    with open(staging_output, "w") as f:
-        json.dump(staging, f, indent=2, ensure_ascii=False)
+    with open(staging_output, "wb") as f:
+        f.write(orjson.dumps(staging, option=orjson.OPT_INDENT_2))
 
     logger.info(f"Wrote {len(anonymised)} anonymised + {len(staging)} staging products to {output}")
     return len(anonymised)
@@ -572,9 +829,13 @@ def main():
     parser.add_argument("--pages", type=int, default=2, help="Pages per category (default: 2)")
     parser.add_argument("--output", default="data/amazon_intelligence.json", help="Output JSON path")
     parser.add_argument("--category", default=None, help="Single category key to scrape")
+    parser.add_argument(
+        "--skip-seen-hours", type=float, default=0,
+        help="Skip products already scraped within this many hours (default: 0, refetch all)",
+    )
     args = parser.parse_args()
 
-    asyncio.run(run(args.pages, args.output, args.category))
+    run_async(run(args.pages, args.output, args.category, args.skip_seen_hours))
 
 
 if __name__ == "__main__":
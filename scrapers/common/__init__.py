@@ -3,6 +3,8 @@ from scrapers.common.base import BaseScraper
 from scrapers.common.models import Product, PricePoint, ScraperResult
 from scrapers.common.storage import LocalStorage, PostgresStorage
 from scrapers.common.rate_limiter import RateLimiter
+from scrapers.common.token_bucket import TokenBucket
+from scrapers.common.http_cache import HttpCache
 from scrapers.common.user_agents import get_random_user_agent
 from scrapers.common.stealth_browser import StealthBrowser, StealthBrowserAsync
 from scrapers.common.data_store import IntelligenceStore
@@ -17,6 +19,8 @@ __all__ = [
     "PostgresStorage",
     "IntelligenceStore",
     "RateLimiter",
+    "TokenBucket",
+    "HttpCache",
     "get_random_user_agent",
     "StealthBrowser",
     "StealthBrowserAsync",
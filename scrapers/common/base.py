@@ -5,20 +5,92 @@ from __future__ import annotations
 import asyncio
 import logging
 import random
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime
+from collections import deque
+from datetime import datetime, timedelta, timezone
 from typing import Optional
+from urllib.parse import urlsplit
 
 import aiohttp
-from fake_useragent import UserAgent
 
+try:
+    import uvloop  # libuv-backed event loop; not available on Windows
+except ImportError:
+    uvloop = None
+
+try:
+    import httpx  # Optional HTTP/2 transport, see BaseScraper(http2=True)
+except ImportError:
+    httpx = None
+
+try:
+    import aiodns  # noqa: F401  -- c-ares lookups for aiohttp.AsyncResolver
+    _HAS_AIODNS = True
+except ImportError:
+    _HAS_AIODNS = False
+
+from scrapers.common.http_cache import HttpCache
 from scrapers.common.models import Product, ScraperResult, Source
 from scrapers.common.rate_limiter import RateLimiter
+from scrapers.common.token_bucket import TokenBucket
 from scrapers.common.user_agents import get_random_user_agent
 from proxy_rotation.manager import StealthProxyManager
 
 logger = logging.getLogger(__name__)
 
+# Per-host circuit breaker: this many 403s within the window pauses every
+# request to the host for the cooldown, instead of burning the rest of the
+# run (and proxy credits) on requests that will all be blocked.
+_BREAKER_THRESHOLD = 5
+_BREAKER_WINDOW = 60.0
+_BREAKER_COOLDOWN = 300.0
+
+# Common cookie banner accept buttons (DE/EN), as one Playwright selector
+# list restricted to visible matches
+_COOKIE_ACCEPT_SELECTOR = ", ".join([
+    "button:has-text('Alle akzeptieren')",
+    "button:has-text('Alle Cookies akzeptieren')",
+    "button:has-text('Accept All')",
+    "button:has-text('Accept all cookies')",
+    "button:has-text('Akzeptieren')",
+    "button:has-text('Zustimmen')",
+    "#onetrust-accept-btn-handler",
+    "[data-testid='cookie-accept']",
+    ".cookie-consent-accept",
+    "button.accept-all",
+    "#CybotCookiebotDialogBodyLevelButtonLevelOptinAllowAll",
+]) + " >> visible=true"
+
+# A run of scroll steps with human pauses, in one evaluate round trip;
+# window.__humanScroll comes from the context init script
+# (StealthBrowser.HUMAN_SCROLL_SCRIPT), with an inline fallback.
+_SCROLL_JS = """async (steps) => {
+    if (window.__humanScroll) return window.__humanScroll(steps);
+    for (let i = 0; i < steps; i++) {
+        window.scrollBy(0, window.innerHeight * (0.3 + Math.random() * 0.5));
+        await new Promise(r => setTimeout(r, 800 + Math.random() * 1700));
+    }
+}"""
+
+
+def _rate_limit_backoff(retry: int) -> float:
+    """Seconds to wait after a 429 on attempt `retry` (0-based).
+
+    "Equal jitter": half the exponential step is fixed, the other half
+    random, so requests throttled together spread out over the whole
+    window instead of retrying in one burst a few seconds apart.
+    """
+    step = (2**retry) * 10
+    return step / 2 + random.uniform(0, step / 2)
+
+
+def run_async(main):
+    """asyncio.run(), on uvloop's faster event loop when it is installed."""
+    if uvloop is not None:
+        return uvloop.run(main)
+    return asyncio.run(main)
+
 
 class BaseScraper(ABC):
     """Abstract base class for all competitor scrapers."""
@@ -31,6 +103,12 @@ class BaseScraper(ABC):
         max_retries: int = 3,
         timeout: int = 30,
         proxy_manager: Optional[StealthProxyManager] = None,
+        pool_size: Optional[int] = None,
+        limit_per_host: Optional[int] = None,
+        rate_per_sec: Optional[float] = None,
+        burst: Optional[int] = None,
+        http_cache: Optional[HttpCache] = None,
+        http2: bool = False,
     ):
         self.source = source
         self.max_concurrent = max_concurrent
@@ -39,35 +117,111 @@ class BaseScraper(ABC):
         self.timeout = timeout
         self.proxy_manager = proxy_manager or StealthProxyManager(use_aws_secrets=False)
         self.rate_limiter = RateLimiter(max_concurrent)
+        # Per-host request pacing. Defaults keep the average rate the old
+        # fixed per-request delay gave (max_concurrent requests per mean
+        # delay) but let idle capacity be spent in bursts.
+        self.rate_per_sec = rate_per_sec or max_concurrent * 2 / sum(request_delay)
+        self.burst = burst or max_concurrent
+        self._buckets: dict[str, TokenBucket] = {}
+        self._host_blocks: dict[str, deque] = {}  # Host -> recent 403 times
+        self._host_open_until: dict[str, float] = {}  # Host -> breaker reset time
+        # Connection pool caps; default to a few connections per slot and
+        # one per slot per host
+        self.pool_size = pool_size or max_concurrent * 4
+        self.limit_per_host = limit_per_host or max_concurrent
         self.session: Optional[aiohttp.ClientSession] = None
-        self._ua = UserAgent(browsers=["chrome", "firefox", "edge"])
+        self.http_cache = http_cache  # Conditional re-fetches in _fetch, if set
+        self.http2 = http2
+        self._httpx = None  # HTTP/2 client, when http2 is requested and usable
+        self._proxy_headers: dict[str, dict] = {}  # Proxy URL -> its fingerprint
 
         # Persistent browser session for JS rendering (created on first use)
         self._browser_mgr = None
         self._browser = None
         self._browser_page_count = 0
-        self._max_pages_per_browser = 15  # Rotate browser after N pages
+        self._max_pages_per_browser = 100  # Relaunch browser after N pages
+        self._standby: Optional[asyncio.Task] = None  # Next browser, launched ahead
+        self._browser_lock = asyncio.Lock()  # Concurrent fetches share one browser
+        # Browsing session (cookies, storage, fingerprint) shared by pages
+        # until rotated; contexts still holding open pages are closed by
+        # the last one to leave.
+        self._context = None
+        self._context_page_count = 0
+        self._max_pages_per_context = 15  # Rotate context after N pages
+        self._context_pages: dict = {}  # Context -> pages currently open on it
 
     async def __aenter__(self):
+        # One pooled connector for the whole run: keep-alive connections and
+        # cached DNS are reused across requests and retries. _fetch only ever
+        # uses this session, never an ephemeral one. With aiodns installed,
+        # lookups run on c-ares in the event loop instead of getaddrinfo()
+        # in the default thread pool.
+        connector = aiohttp.TCPConnector(
+            resolver=aiohttp.AsyncResolver() if _HAS_AIODNS else None,
+            limit=self.pool_size,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=300,
+            keepalive_timeout=30,
+            enable_cleanup_closed=True,
+        )
         self.session = aiohttp.ClientSession(
+            connector=connector,
             timeout=aiohttp.ClientTimeout(total=self.timeout),
             headers=self._default_headers(),
+            trust_env=True,
         )
+        if self.http2:
+            self._httpx = self._http2_client()
         return self
 
+    def _http2_client(self):
+        """httpx client multiplexing requests per host over HTTP/2.
+
+        httpx binds the proxy to the client, so this is only used without a
+        proxy or with a single fixed one; a rotating pool stays on aiohttp.
+        """
+        if httpx is None:
+            logger.warning(f"[{self.source.value}] httpx not installed, staying on HTTP/1.1")
+            return None
+        if self.proxy_manager.pool_size > 1:
+            logger.warning(f"[{self.source.value}] HTTP/2 unavailable with rotating proxies, staying on HTTP/1.1")
+            return None
+        return httpx.AsyncClient(
+            http2=True,
+            proxy=self.proxy_manager.get_proxy_url(),
+            headers=self._default_headers(),
+            limits=httpx.Limits(
+                max_connections=self.pool_size,
+                max_keepalive_connections=self.limit_per_host,
+            ),
+            timeout=self.timeout,
+            follow_redirects=True,
+            trust_env=True,
+        )
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self.session:
             await self.session.close()
+        if self._httpx:
+            await self._httpx.aclose()
+            self._httpx = None
         await self._close_browser()
 
     async def _close_browser(self):
-        """Cleanly shut down the persistent browser."""
-        if self._browser:
+        """Cleanly shut down the persistent browser, its standby and retirees."""
+        browsers = {self._browser, *(c.browser for c in self._context_pages)}
+        if self._standby:
             try:
-                await self._browser.close()
+                browsers.add(await self._standby)
             except Exception:
                 pass
-            self._browser = None
+            self._standby = None
+        for browser in browsers - {None}:
+            try:
+                await browser.close()
+            except Exception:
+                pass
+        self._browser = None
         if self._browser_mgr:
             try:
                 await self._browser_mgr.stop()
@@ -75,115 +229,251 @@ class BaseScraper(ABC):
                 pass
             self._browser_mgr = None
         self._browser_page_count = 0
+        self._context = None
+        self._context_page_count = 0
+        self._context_pages.clear()
 
-    async def _get_browser(self):
-        """Get or create a persistent browser instance.
+    async def _swap_browser(self):
+        """Replace the browser with the warm standby and launch the next one.
 
-        Rotates the browser every N pages to avoid detection from
-        long-lived sessions while still avoiding the per-request
-        browser creation that triggers bot detection.
+        The old browser keeps serving pages already open on it and is closed
+        once the last of them is released.
         """
-        if self._browser_page_count >= self._max_pages_per_browser:
-            logger.info(f"[{self.source.value}] Rotating browser after {self._browser_page_count} pages")
-            await self._close_browser()
+        old = self._browser
+        try:
+            self._browser = await self._standby
+        except Exception as e:
+            logger.warning(f"[{self.source.value}] Standby browser failed to launch: {e}")
+            self._browser = await self._browser_mgr.new_browser()
+        self._standby = asyncio.create_task(self._browser_mgr.new_browser())
+        self._browser_page_count = 0
 
-        if not self._browser_mgr:
-            from scrapers.common.stealth_browser import StealthBrowserAsync
+        old_context, self._context = self._context, None
+        if old_context is not None and not self._context_pages.get(old_context):
+            self._context_pages.pop(old_context, None)
+            await self._close_context(old_context)
+        await self._close_if_retired(old)
+
+    async def _get_context(self):
+        """Get a browser context to open the next page in.
+
+        Pages share one context, like tabs in a real user's browsing session,
+        and the context is swapped for a fresh one (new fingerprint, empty
+        cookie jar) every N pages. Closing contexts is what frees Playwright's
+        per-page bookkeeping, so the browser itself can live much longer; it
+        is replaced every N contexts' worth of pages by a standby launched in
+        the background, so rotation never waits on a cold start. Each call
+        reserves a page slot on the returned context; the caller must hand it
+        back with _release_context().
+        """
+        async with self._browser_lock:
+            if not self._browser_mgr:
+                from scrapers.common.stealth_browser import StealthBrowserAsync
+
+                self._browser_mgr = StealthBrowserAsync(self.proxy_manager)
+                await self._browser_mgr.start()
+                self._browser = await self._browser_mgr.new_browser()
+                self._standby = asyncio.create_task(self._browser_mgr.new_browser())
+                self._browser_page_count = 0
+            elif self._browser_page_count >= self._max_pages_per_browser:
+                logger.info(f"[{self.source.value}] Rotating browser after {self._browser_page_count} pages")
+                await self._swap_browser()
+
+            if self._context is None or self._context_page_count >= self._max_pages_per_context:
+                old = self._context
+                self._context = await self._browser_mgr.new_context(self._browser)
+                self._context_pages[self._context] = 0
+                self._context_page_count = 0
+                if old is not None and not self._context_pages.get(old):
+                    self._context_pages.pop(old, None)
+                    await self._close_context(old)
 
-            self._browser_mgr = StealthBrowserAsync(self.proxy_manager)
-            await self._browser_mgr.start()
-            self._browser = await self._browser_mgr.new_browser()
-            self._browser_page_count = 0
+            self._browser_page_count += 1
+            self._context_page_count += 1
+            self._context_pages[self._context] += 1
+            return self._context
+
+    async def _release_context(self, context):
+        """Return a page slot taken by _get_context()."""
+        async with self._browser_lock:
+            if context not in self._context_pages:
+                return  # Browser was torn down meanwhile
+            self._context_pages[context] -= 1
+            if not self._context_pages[context] and context is not self._context:
+                del self._context_pages[context]
+                await self._close_context(context)
+                await self._close_if_retired(context.browser)
+
+    async def _close_if_retired(self, browser):
+        """Close a swapped-out browser once no context is left open on it."""
+        if browser is None or browser is self._browser:
+            return
+        if any(c.browser is browser for c in self._context_pages):
+            return
+        try:
+            await browser.close()
+        except Exception:
+            pass
+
+    @staticmethod
+    async def _close_context(context):
+        try:
+            await context.close()
+        except Exception:
+            pass
 
-        return self._browser_mgr, self._browser
+    def _retire_browser(self):
+        """Have the next _get_context() swap in the standby browser."""
+        self._browser_page_count = max(self._browser_page_count, self._max_pages_per_browser)
 
     def _default_headers(self) -> dict:
         """Use stealth proxy manager headers for realistic browser fingerprinting."""
         return self.proxy_manager.get_headers()
 
-    async def _fetch(self, url: str, retry: int = 0) -> Optional[str]:
-        """Fetch a URL with retry logic, rate limiting, and random delays."""
-        async with self.rate_limiter:
-            delay = random.uniform(*self.request_delay)
-            await asyncio.sleep(delay)
+    def _headers_for(self, proxy_url: str) -> dict:
+        """Stable fingerprint for one proxy of a rotating pool.
 
-            try:
-                headers = self.proxy_manager.get_headers()
-                proxy_url = self.proxy_manager.get_proxy_url()
-                kwargs = {"headers": headers}
-                if proxy_url:
-                    kwargs["proxy"] = proxy_url
-
-                async with self.session.get(url, **kwargs) as response:
-                    if response.status == 200:
+        Each exit IP keeps the same headers for the whole run, built on first
+        use. Without a rotating pool the session's default headers are sent
+        as-is, so the single exit IP also keeps one fingerprint.
+        """
+        headers = self._proxy_headers.get(proxy_url)
+        if headers is None:
+            headers = self._proxy_headers[proxy_url] = self.proxy_manager.get_headers()
+        return headers
+
+    def _bucket_for(self, url: str) -> TokenBucket:
+        """Token bucket for the URL's host, so hosts don't starve each other."""
+        host = urlsplit(url).netloc
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = TokenBucket(self.rate_per_sec, self.burst)
+        return bucket
+
+    def _record_block(self, host: str):
+        """Count a 403 from `host`, tripping its breaker past the threshold."""
+        now = time.monotonic()
+        hits = self._host_blocks.setdefault(host, deque())
+        hits.append(now)
+        while hits[0] < now - _BREAKER_WINDOW:
+            hits.popleft()
+        if len(hits) >= _BREAKER_THRESHOLD and self._host_open_until.get(host, 0) <= now:
+            hits.clear()
+            self._host_open_until[host] = now + _BREAKER_COOLDOWN
+            logger.warning(
+                f"[{self.source.value}] {host} blocked {_BREAKER_THRESHOLD}x within "
+                f"{_BREAKER_WINDOW:.0f}s, pausing it for {_BREAKER_COOLDOWN:.0f}s"
+            )
+            self._retire_browser()
+
+    def _record_ok(self, host: str):
+        """A successful response resets the host's 403 count."""
+        self._host_blocks.pop(host, None)
+
+    async def _wait_for_host(self, host: str):
+        """Sleep out the host's breaker cooldown, if it is tripped."""
+        wait = self._host_open_until.get(host, 0) - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def _get(self, url: str, proxy: Optional[str] = None, headers: Optional[dict] = None):
+        """One GET on the session (or the HTTP/2 client, when enabled).
+
+        Returns (status, headers, body, charset); the body is only read
+        for a 200.
+        """
+        if self._httpx is not None:
+            # The client carries its own fixed proxy
+            response = await self._httpx.get(url, headers=headers)
+            body = response.content if response.status_code == 200 else b""
+            return response.status_code, response.headers, body, response.charset_encoding
+        async with self.session.get(url, proxy=proxy, headers=headers) as response:
+            body = await response.read() if response.status == 200 else b""
+            return response.status, response.headers, body, response.charset
+
+    async def _fetch(self, url: str) -> Optional[str]:
+        """Fetch a URL with retry logic, per-host pacing, and concurrency limits."""
+        host = urlsplit(url).netloc
+        bucket = self._bucket_for(url)
+        for retry in range(self.max_retries + 1):
+            # Pacing and back-off sleeps happen outside the concurrency slot,
+            # so a waiting request never blocks others.
+            await self._wait_for_host(host)
+            await bucket.acquire()
+            backoff = None
+            async with self.rate_limiter:
+                try:
+                    proxy_url = self.proxy_manager.get_proxy_url()
+                    kwargs = {}
+                    if proxy_url:
+                        kwargs["proxy"] = proxy_url
+                        if self.proxy_manager.pool_size > 1:
+                            kwargs["headers"] = self._headers_for(proxy_url)
+                    if self.http_cache and (validators := self.http_cache.conditional_headers(url)):
+                        kwargs["headers"] = {**kwargs.get("headers", {}), **validators}
+
+                    status, resp_headers, body, charset = await self._get(url, **kwargs)
+                    if status == 200:
+                        if proxy_url:
+                            self.proxy_manager.report_success(proxy_url)
+                        self._record_ok(host)
+                        # Decode by the declared charset, else UTF-8, rather
+                        # than sniff the whole body for one
+                        text = body.decode(charset or "utf-8", errors="replace")
+                        if self.http_cache and "no-store" not in resp_headers.get("Cache-Control", ""):
+                            self.http_cache.put(
+                                url, resp_headers.get("ETag"), resp_headers.get("Last-Modified"), text
+                            )
+                        return text
+                    elif status == 304 and self.http_cache:
                         if proxy_url:
                             self.proxy_manager.report_success(proxy_url)
-                        return await response.text()
-                    elif response.status == 429:
-                        wait = (2**retry) * 5 + random.uniform(1, 5)
+                        self._record_ok(host)
+                        return self.http_cache.body(url)
+                    elif status == 429:
+                        backoff = _rate_limit_backoff(retry)
                         logger.warning(
                             f"[{self.source.value}] Rate limited on {url}, "
-                            f"waiting {wait:.1f}s (retry {retry + 1}/{self.max_retries})"
+                            f"waiting {backoff:.1f}s (retry {retry + 1}/{self.max_retries})"
                         )
-                        await asyncio.sleep(wait)
-                        if retry < self.max_retries:
-                            return await self._fetch(url, retry + 1)
-                    elif response.status == 403:
+                    elif status == 403:
                         if proxy_url:
                             self.proxy_manager.report_failure(proxy_url)
                         logger.warning(f"[{self.source.value}] Blocked (403) on {url}")
-                        if retry < self.max_retries:
-                            await asyncio.sleep(random.uniform(10, 30))
-                            return await self._fetch(url, retry + 1)
+                        self._record_block(host)
+                        backoff = random.uniform(10, 30)
                     else:
-                        logger.error(f"[{self.source.value}] HTTP {response.status} on {url}")
-            except asyncio.TimeoutError:
-                logger.error(f"[{self.source.value}] Timeout on {url}")
-                if retry < self.max_retries:
-                    return await self._fetch(url, retry + 1)
-            except Exception as e:
-                logger.error(f"[{self.source.value}] Error fetching {url}: {e}")
-                if retry < self.max_retries:
-                    return await self._fetch(url, retry + 1)
+                        logger.error(f"[{self.source.value}] HTTP {status} on {url}")
+                except asyncio.TimeoutError:
+                    logger.error(f"[{self.source.value}] Timeout on {url}")
+                    backoff = random.uniform(*self.request_delay)
+                except Exception as e:
+                    logger.error(f"[{self.source.value}] Error fetching {url}: {e}")
+                    backoff = random.uniform(*self.request_delay)
 
+            if backoff is None or retry >= self.max_retries:
+                break
+            await asyncio.sleep(backoff)
         return None
 
     async def _dismiss_cookie_banner(self, page) -> None:
-        """Attempt to dismiss common cookie consent banners."""
-        cookie_selectors = [
-            # Common cookie banner buttons (DE/EN)
-            "button:has-text('Alle akzeptieren')",
-            "button:has-text('Alle Cookies akzeptieren')",
-            "button:has-text('Accept All')",
-            "button:has-text('Accept all cookies')",
-            "button:has-text('Akzeptieren')",
-            "button:has-text('Zustimmen')",
-            "#onetrust-accept-btn-handler",
-            "[data-testid='cookie-accept']",
-            ".cookie-consent-accept",
-            "button.accept-all",
-            "#CybotCookiebotDialogBodyLevelButtonLevelOptinAllowAll",
-        ]
-        for selector in cookie_selectors:
-            try:
-                btn = await page.query_selector(selector)
-                if btn and await btn.is_visible():
-                    await btn.click()
-                    logger.info(f"[{self.source.value}] Dismissed cookie banner via '{selector}'")
-                    await asyncio.sleep(random.uniform(0.5, 1.5))
-                    return
-            except Exception:
-                continue
+        """Attempt to dismiss common cookie consent banners.
+
+        All known accept buttons are matched by one locator, so the usual
+        no-banner case costs a single round trip instead of one per selector.
+        """
+        try:
+            btn = page.locator(_COOKIE_ACCEPT_SELECTOR).first
+            if await btn.count():
+                await btn.click(timeout=5000)
+                logger.info(f"[{self.source.value}] Dismissed cookie banner")
+                await asyncio.sleep(random.uniform(0.5, 1.5))
+        except Exception:
+            pass
 
     async def _human_scroll(self, page, scrolls: int = 3) -> None:
         """Simulate realistic human scrolling behaviour."""
-        for _ in range(scrolls):
-            await page.evaluate(
-                """() => {
-                    window.scrollBy(0, window.innerHeight * (0.3 + Math.random() * 0.5));
-                }"""
-            )
-            await asyncio.sleep(random.uniform(0.8, 2.5))
+        await page.evaluate(_SCROLL_JS, scrolls)
 
     async def _fetch_js(
         self,
@@ -194,69 +484,77 @@ class BaseScraper(ABC):
     ) -> Optional[str]:
         """Fetch a URL using a persistent Playwright browser session.
 
-        Reuses a single browser across multiple pages (rotated every N pages)
-        to mimic a real user browsing session rather than a bot spawning
-        one browser per request.
+        Reuses a single browser and browsing context across multiple pages
+        (each rotated every N pages) to mimic a real user browsing session
+        rather than a bot spawning one browser per request.
         """
+        host = urlsplit(url).netloc
+        await self._wait_for_host(host)
+        retry_wait = None
         try:
-            browser_mgr, browser = await self._get_browser()
-            page = await browser_mgr.new_page(browser)
-            self._browser_page_count += 1
-
+            context = await self._get_context()
             try:
-                # Random pre-navigation delay to look human
-                await asyncio.sleep(random.uniform(1.0, 3.0))
-
-                # Navigate
-                response = await page.goto(url, wait_until="domcontentloaded", timeout=timeout_ms)
-
-                if response and response.status >= 400:
-                    logger.warning(f"[{self.source.value}] HTTP {response.status} on {url}")
-                    if retry < self.max_retries and response.status in (403, 429):
-                        await page.close()
-                        wait = random.uniform(10, 30) * (retry + 1)
-                        logger.info(f"[{self.source.value}] Retrying in {wait:.0f}s...")
-                        await asyncio.sleep(wait)
-                        # Force browser rotation on 403
-                        if response.status == 403:
-                            await self._close_browser()
-                        return await self._fetch_js(url, wait_selector, timeout_ms, retry + 1)
-
-                # Dismiss cookie consent if present
-                await self._dismiss_cookie_banner(page)
-
-                # Wait for target content
+                page = await self._browser_mgr.open_page(context)
                 try:
-                    await page.wait_for_selector(wait_selector, timeout=15000)
-                except Exception:
-                    logger.warning(f"[{self.source.value}] Selector '{wait_selector}' not found on {url}, continuing...")
-
-                # Simulate human browsing behaviour
-                await self._human_scroll(page)
+                    # Random pre-navigation delay to look human
+                    await asyncio.sleep(random.uniform(1.0, 3.0))
 
-                # Let lazy-loaded content render
-                await asyncio.sleep(random.uniform(1.5, 4.0))
-
-                html = await page.content()
-                return html
+                    # Navigate
+                    response = await page.goto(url, wait_until="domcontentloaded", timeout=timeout_ms)
 
+                    if response and response.status >= 400:
+                        logger.warning(f"[{self.source.value}] HTTP {response.status} on {url}")
+                        if response.status == 403:
+                            self._record_block(host)
+                        if retry < self.max_retries and response.status in (403, 429):
+                            retry_wait = random.uniform(10, 30) * (retry + 1)
+                            # Force browser rotation on 403
+                            if response.status == 403:
+                                self._retire_browser()
+                    elif response:
+                        self._record_ok(host)
+
+                    if retry_wait is None:
+                        # Dismiss cookie consent if present
+                        await self._dismiss_cookie_banner(page)
+
+                        # Wait for target content
+                        try:
+                            await page.wait_for_selector(wait_selector, timeout=15000)
+                        except Exception:
+                            logger.warning(f"[{self.source.value}] Selector '{wait_selector}' not found on {url}, continuing...")
+
+                        # Simulate human browsing behaviour
+                        await self._human_scroll(page)
+
+                        # Let lazy-loaded content render
+                        await asyncio.sleep(random.uniform(1.5, 4.0))
+
+                        return await page.content()
+
+                finally:
+                    try:
+                        await page.close()
+                    except Exception:
+                        pass
             finally:
-                try:
-                    await page.close()
-                except Exception:
-                    pass
+                await self._release_context(context)
 
         except ImportError:
             logger.warning(f"[{self.source.value}] Playwright not installed, falling back to aiohttp for {url}")
             return await self._fetch(url)
         except Exception as e:
             logger.error(f"[{self.source.value}] Playwright error on {url}: {e}")
-            # On error, close browser so next request gets a fresh one
-            await self._close_browser()
-            if retry < self.max_retries:
-                await asyncio.sleep(random.uniform(5, 15))
-                return await self._fetch_js(url, wait_selector, timeout_ms, retry + 1)
-            return None
+            # On error, replace the browser so next request gets a fresh one
+            self._retire_browser()
+            if retry >= self.max_retries:
+                return None
+            retry_wait = random.uniform(5, 15)
+
+        # Back off outside the browser so rotation is not held up meanwhile
+        logger.info(f"[{self.source.value}] Retrying in {retry_wait:.0f}s...")
+        await asyncio.sleep(retry_wait)
+        return await self._fetch_js(url, wait_selector, timeout_ms, retry + 1)
 
     @abstractmethod
     async def get_category_urls(self) -> list:
@@ -273,9 +571,48 @@ class BaseScraper(ABC):
         """Parse a product page and return a Product model."""
         ...
 
+    async def _fetch_and_parse_listing(self, url: str, errors: list) -> Optional[list]:
+        """Fetch and parse one listing page.
+
+        Returns its product URLs, or None if the page could not be fetched.
+        Parse failures are appended to `errors` and yield an empty list.
+        """
+        html = await self._fetch(url)
+        if not html:
+            return None
+        try:
+            return await self.parse_listing(html, url)
+        except Exception as e:
+            errors.append(f"Listing parse error ({url}): {e}")
+            return []
+
+    async def _fetch_and_parse_product(self, url: str, errors: list):
+        """Fetch and parse one product page.
+
+        Returns the Product, False if the page was fetched but yielded no
+        product, or None if it could not be fetched. Parse failures are
+        appended to `errors`.
+        """
+        html = await self._fetch(url)
+        if not html:
+            return None
+        try:
+            return await self.parse_product(html, url) or False
+        except Exception as e:
+            errors.append(f"Product parse error ({url}): {e}")
+            return False
+
     async def scrape(self) -> ScraperResult:
-        """Run the full scraping pipeline."""
-        started_at = datetime.utcnow()
+        """Run the full scraping pipeline.
+
+        Listing and product pages are pipelined: product URLs are queued as
+        soon as their listing page is parsed, and product workers start on
+        them while the remaining listings are still loading. The queue is
+        bounded, so listings can't run far ahead of the product workers.
+        """
+        # Wall-clock stamp for the record, monotonic clock for the duration
+        started_at = datetime.now(timezone.utc)
+        started = time.monotonic()
         products = []
         errors = []
         total_pages = 0
@@ -283,36 +620,56 @@ class BaseScraper(ABC):
         logger.info(f"[{self.source.value}] Starting scrape...")
 
         category_urls = await self.get_category_urls()
-        product_urls = []
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_concurrent * 4)
+        seen: set[str] = set()  # Product URLs already queued
 
-        # Phase 1: Collect product URLs from listing pages
-        for cat_url in category_urls:
-            html = await self._fetch(cat_url)
-            if html:
-                total_pages += 1
+        # Phase 1 (producers): listing pages -> product URLs
+        async def crawl_listing(cat_url: str):
+            nonlocal total_pages
+            try:
+                urls = await self._fetch_and_parse_listing(cat_url, errors)
+            except Exception as e:
+                errors.append(f"Listing fetch error ({cat_url}): {e}")
+                return
+            if urls is None:
+                return
+            total_pages += 1
+            for u in urls:
+                if u not in seen:
+                    seen.add(u)
+                    await queue.put(u)
+
+        # Phase 2 (consumers): product pages, started while listings load.
+        # One worker per rate limiter slot keeps every slot busy.
+        async def scrape_products():
+            nonlocal total_pages
+            while (url := await queue.get()) is not None:
                 try:
-                    urls = await self.parse_listing(html, cat_url)
-                    product_urls.extend(urls)
+                    product = await self._fetch_and_parse_product(url, errors)
                 except Exception as e:
-                    errors.append(f"Listing parse error ({cat_url}): {e}")
-
-        # Deduplicate
-        product_urls = list(set(product_urls))
-        logger.info(f"[{self.source.value}] Found {len(product_urls)} product URLs")
-
-        # Phase 2: Scrape individual product pages
-        for url in product_urls:
-            html = await self._fetch(url)
-            if html:
-                total_pages += 1
-                try:
-                    product = await self.parse_product(html, url)
+                    errors.append(f"Product fetch error ({url}): {e}")
+                    continue
+                if product is not None:
+                    total_pages += 1
                     if product:
                         products.append(product)
-                except Exception as e:
-                    errors.append(f"Product parse error ({url}): {e}")
 
-        finished_at = datetime.utcnow()
+        workers = [asyncio.create_task(scrape_products()) for _ in range(self.max_concurrent)]
+        try:
+            # Listing tasks are created a chunk at a time so huge category
+            # lists don't materialise one pending task per URL up front
+            chunk_size = max(self.max_concurrent * 20, 500)
+            for i in range(0, len(category_urls), chunk_size):
+                await asyncio.gather(*(crawl_listing(u) for u in category_urls[i:i + chunk_size]))
+            logger.info(f"[{self.source.value}] Found {len(seen)} product URLs")
+            for _ in workers:
+                await queue.put(None)  # One stop marker per worker
+            await asyncio.gather(*workers)
+        finally:
+            for w in workers:
+                w.cancel()
+
+        finished_at = started_at + timedelta(seconds=time.monotonic() - started)
         result = ScraperResult(
             source=self.source,
             products=products,
@@ -6,13 +6,15 @@ acquisition codes. Source mappings are stored encrypted in a separate
 table and can only be decrypted by your purchasing team.
 """
 
+import io
 import json
 import logging
 import os
+from contextlib import contextmanager
 from typing import Optional
 
-import psycopg2
-from psycopg2.extras import Json
+from psycopg2.extras import Json, execute_values
+from psycopg2.pool import ThreadedConnectionPool
 
 logger = logging.getLogger(__name__)
 
@@ -43,9 +45,23 @@ CREATE TABLE IF NOT EXISTS source_mappings (
 );
 
 CREATE INDEX IF NOT EXISTS idx_products_hash ON products(product_hash);
-CREATE INDEX IF NOT EXISTS idx_products_category ON products(category);
-CREATE INDEX IF NOT EXISTS idx_products_brand ON products(brand_type);
-CREATE INDEX IF NOT EXISTS idx_products_price ON products(price_tier);
+-- Composite indexes for search_products' filters and its ORDER BY; they
+-- replace the per-column category / brand_type / price_tier indexes.
+-- idx_products_search serves category-led searches; the other two keep
+-- brand- and tier-only searches (no category) indexed.
+DROP INDEX IF EXISTS idx_products_category;
+DROP INDEX IF EXISTS idx_products_brand;
+DROP INDEX IF EXISTS idx_products_price;
+CREATE INDEX IF NOT EXISTS idx_products_search
+    ON products (category, brand_type, price_tier, last_updated DESC);
+CREATE INDEX IF NOT EXISTS idx_products_brand_search
+    ON products (brand_type, price_tier, last_updated DESC);
+CREATE INDEX IF NOT EXISTS idx_products_tier_search
+    ON products (price_tier, last_updated DESC);
+-- jsonb_path_ops GIN: indexed @> containment lookups on the signal columns
+CREATE INDEX IF NOT EXISTS idx_products_efficacy_gin ON products USING GIN (efficacy_signals jsonb_path_ops);
+CREATE INDEX IF NOT EXISTS idx_products_ingredients_gin ON products USING GIN (ingredient_profile jsonb_path_ops);
+CREATE INDEX IF NOT EXISTS idx_products_market_gin ON products USING GIN (market_signals jsonb_path_ops);
 CREATE INDEX IF NOT EXISTS idx_source_lead ON source_mappings(acquisition_lead);
 
 CREATE TABLE IF NOT EXISTS purchase_orders (
@@ -77,6 +93,96 @@ CREATE INDEX IF NOT EXISTS idx_rec_user ON recommendation_logs(user_id);
 CREATE INDEX IF NOT EXISTS idx_rec_created ON recommendation_logs(created_at DESC);
 """
 
+_PRODUCT_COLUMNS = """product_hash, category, name_clean, brand_type, price_tier,
+    efficacy_signals, ingredient_profile, market_signals,
+    acquisition_lead, last_updated"""
+
+_PRODUCT_ON_CONFLICT = """ON CONFLICT (product_hash) DO UPDATE SET
+    category = EXCLUDED.category,
+    name_clean = EXCLUDED.name_clean,
+    brand_type = EXCLUDED.brand_type,
+    price_tier = EXCLUDED.price_tier,
+    efficacy_signals = EXCLUDED.efficacy_signals,
+    ingredient_profile = EXCLUDED.ingredient_profile,
+    market_signals = EXCLUDED.market_signals,
+    acquisition_lead = EXCLUDED.acquisition_lead,
+    last_updated = EXCLUDED.last_updated"""
+
+_PRODUCT_UPSERT = f"""INSERT INTO products ({_PRODUCT_COLUMNS})
+VALUES %s
+{_PRODUCT_ON_CONFLICT}"""
+
+# Large batches are COPYed into a transaction-scoped staging table and
+# merged with one INSERT ... SELECT, skipping per-row VALUES parsing.
+_COPY_THRESHOLD = 1024
+
+_PRODUCT_STAGE = f"""CREATE TEMP TABLE products_stage ON COMMIT DROP AS
+SELECT {_PRODUCT_COLUMNS} FROM products WITH NO DATA"""
+
+_PRODUCT_STAGE_MERGE = f"""INSERT INTO products ({_PRODUCT_COLUMNS})
+SELECT {_PRODUCT_COLUMNS} FROM products_stage
+{_PRODUCT_ON_CONFLICT}"""
+
+# JSONB columns searchable with search_products_by_signal (GIN-indexed)
+_SIGNAL_FIELDS = ("efficacy_signals", "ingredient_profile", "market_signals")
+
+_MAPPING_UPSERT = """INSERT INTO source_mappings (acquisition_lead, encrypted_mapping)
+VALUES %s
+ON CONFLICT (acquisition_lead) DO UPDATE SET
+    encrypted_mapping = EXCLUDED.encrypted_mapping"""
+
+
+def _product_row(product: dict) -> tuple:
+    """Column values of an anonymised product, in _PRODUCT_UPSERT order."""
+    return (
+        product["product_hash"],
+        product.get("category"),
+        product.get("name_clean"),
+        product.get("brand_type"),
+        product.get("price_tier"),
+        Json(product.get("efficacy_signals", {})),
+        Json(product.get("ingredient_profile", {})),
+        Json(product.get("market_signals", {})),
+        product.get("acquisition_lead"),
+        product.get("last_updated"),
+    )
+
+
+def _csv_field(value) -> str:
+    """One COPY CSV field.
+
+    NULL is an unquoted empty field and everything else is quoted, so empty
+    strings survive as empty strings.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value)
+    elif hasattr(value, "isoformat"):
+        value = value.isoformat()
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def _product_csv(products) -> io.StringIO:
+    """Anonymised products as COPY CSV, columns in _PRODUCT_COLUMNS order."""
+    buf = io.StringIO()
+    for p in products:
+        buf.write(",".join(_csv_field(v) for v in (
+            p["product_hash"],
+            p.get("category"),
+            p.get("name_clean"),
+            p.get("brand_type"),
+            p.get("price_tier"),
+            p.get("efficacy_signals", {}),
+            p.get("ingredient_profile", {}),
+            p.get("market_signals", {}),
+            p.get("acquisition_lead"),
+            p.get("last_updated"),
+        )))
+        buf.write("\n")
+    buf.seek(0)
+    return buf
+
 
 class IntelligenceStore:
     """Stores scraped data with encrypted source mapping.
@@ -93,35 +199,63 @@ class IntelligenceStore:
         user: Optional[str] = None,
         password: Optional[str] = None,
         kms_key_alias: str = "alias/intelligence-encryption",
+        min_connections: int = 2,
+        max_connections: int = 20,
     ):
-        self.db = psycopg2.connect(
-            host=host or os.environ.get(
-                "INTELLIGENCE_DB_HOST",
-                os.environ.get("RDS_HOST", "localhost"),
-            ),
-            database=database or os.environ.get(
-                "INTELLIGENCE_DB_NAME",
-                os.environ.get("RDS_DATABASE", "intelligence"),
-            ),
-            user=user or os.environ.get(
-                "INTELLIGENCE_DB_USER",
-                os.environ.get("RDS_USERNAME", "scraper_write"),
-            ),
-            password=password or self._get_db_password(),
-            sslmode="require" if os.environ.get("AWS_DEFAULT_REGION") else "prefer",
-        )
-        self.db.autocommit = False
+        pgbouncer_url = os.environ.get("INTELLIGENCE_DB_PGBOUNCER_URL")
+        if pgbouncer_url and not host:
+            # PgBouncer in transaction pooling mode (see DEPLOYMENT.md): every
+            # worker's connections share a few server connections. The store
+            # keeps no session state across transactions -- no SET SESSION,
+            # named cursors or prepared statements, and the COPY staging
+            # table is dropped on commit -- so this is safe.
+            conninfo = {"dsn": pgbouncer_url}
+        else:
+            conninfo = {
+                "host": host or os.environ.get(
+                    "INTELLIGENCE_DB_HOST",
+                    os.environ.get("RDS_HOST", "localhost"),
+                ),
+                "database": database or os.environ.get(
+                    "INTELLIGENCE_DB_NAME",
+                    os.environ.get("RDS_DATABASE", "intelligence"),
+                ),
+                "user": user or os.environ.get(
+                    "INTELLIGENCE_DB_USER",
+                    os.environ.get("RDS_USERNAME", "scraper_write"),
+                ),
+                "password": password or self._get_db_password(),
+                "sslmode": "require" if os.environ.get("AWS_DEFAULT_REGION") else "prefer",
+            }
+
+        # Each operation checks a connection out of the pool, so threads
+        # sharing one store don't serialise on a single connection.
+        self._pool = ThreadedConnectionPool(min_connections, max_connections, **conninfo)
 
         # Initialise schema
-        with self.db.cursor() as cur:
-            cur.execute(INTELLIGENCE_SCHEMA)
-        self.db.commit()
+        with self._connection() as db:
+            with db.cursor() as cur:
+                cur.execute(INTELLIGENCE_SCHEMA)
+            db.commit()
 
         # Encryption for source mapping (separate from application data)
         self.cipher = None
         self.kms_key_alias = kms_key_alias
         self._init_encryption()
 
+    @contextmanager
+    def _connection(self):
+        """Borrow a pooled connection for one operation.
+
+        The pool rolls back anything left uncommitted when the connection
+        is returned, so read-only callers need not end their transaction.
+        """
+        db = self._pool.getconn()
+        try:
+            yield db
+        finally:
+            self._pool.putconn(db)
+
     def _get_db_password(self) -> str:
         """Load DB password from AWS Secrets Manager or env var."""
         password = os.environ.get("INTELLIGENCE_DB_PASSWORD") or os.environ.get("RDS_PASSWORD")
@@ -180,76 +314,66 @@ class IntelligenceStore:
             source_mapping: Optional dict with source URL, IDs, etc.
                 Only stored if KMS encryption is available.
         """
-        cur = self.db.cursor()
-
         try:
-            # Main product table -- no source info
-            cur.execute(
-                """INSERT INTO products (
-                    product_hash, category, name_clean, brand_type, price_tier,
-                    efficacy_signals, ingredient_profile, market_signals,
-                    acquisition_lead, last_updated
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (product_hash) DO UPDATE SET
-                    category = EXCLUDED.category,
-                    name_clean = EXCLUDED.name_clean,
-                    brand_type = EXCLUDED.brand_type,
-                    price_tier = EXCLUDED.price_tier,
-                    efficacy_signals = EXCLUDED.efficacy_signals,
-                    ingredient_profile = EXCLUDED.ingredient_profile,
-                    market_signals = EXCLUDED.market_signals,
-                    acquisition_lead = EXCLUDED.acquisition_lead,
-                    last_updated = EXCLUDED.last_updated""",
-                (
-                    anonymized_product["product_hash"],
-                    anonymized_product.get("category"),
-                    anonymized_product.get("name_clean"),
-                    anonymized_product.get("brand_type"),
-                    anonymized_product.get("price_tier"),
-                    Json(anonymized_product.get("efficacy_signals", {})),
-                    Json(anonymized_product.get("ingredient_profile", {})),
-                    Json(anonymized_product.get("market_signals", {})),
-                    anonymized_product.get("acquisition_lead"),
-                    anonymized_product.get("last_updated"),
-                ),
-            )
-
-            # Source mapping in separate table, encrypted
-            if source_mapping and self.cipher:
-                encrypted = self.cipher.encrypt(
-                    json.dumps(source_mapping).encode("utf-8")
-                )
-                cur.execute(
-                    """INSERT INTO source_mappings (acquisition_lead, encrypted_mapping)
-                    VALUES (%s, %s)
-                    ON CONFLICT (acquisition_lead) DO UPDATE SET
-                        encrypted_mapping = EXCLUDED.encrypted_mapping""",
-                    (
-                        anonymized_product["acquisition_lead"],
-                        encrypted,
-                    ),
-                )
-
-            self.db.commit()
-
+            self._upsert([anonymized_product], [source_mapping])
         except Exception as e:
-            self.db.rollback()
             logger.error(f"Failed to store product: {e}")
             raise
-        finally:
-            cur.close()
 
     def store_batch(
         self,
         products: list[dict],
         source_mappings: Optional[list[dict]] = None,
     ):
-        """Store multiple products in a single transaction."""
-        mappings = source_mappings or [None] * len(products)
-        for product, mapping in zip(products, mappings):
-            self.store_product(product, mapping)
+        """Store multiple products in a single transaction.
+
+        One multi-row upsert per table instead of a round trip per product.
+        """
+        try:
+            self._upsert(products, source_mappings or [None] * len(products))
+        except Exception as e:
+            logger.error(f"Failed to store batch of {len(products)} products: {e}")
+            raise
         logger.info(f"Stored batch of {len(products)} products")
 
+    def _upsert(self, products: list[dict], source_mappings: list[Optional[dict]]):
+        """Upsert products and their encrypted source mappings, then commit."""
+        # A multi-row upsert can't touch the same key twice, so duplicates
+        # within the batch collapse to their last occurrence.
+        latest = list({p["product_hash"]: p for p in products}.values())
+        encrypted = {}
+        if self.cipher:
+            for product, mapping in zip(products, source_mappings):
+                if mapping:
+                    encrypted[product["acquisition_lead"]] = self.cipher.encrypt(
+                        json.dumps(mapping).encode("utf-8")
+                    )
+
+        with self._connection() as db:
+            cur = db.cursor()
+            try:
+                # Main product table -- no source info
+                if len(latest) >= _COPY_THRESHOLD:
+                    cur.execute(_PRODUCT_STAGE)
+                    cur.copy_expert(
+                        f"COPY products_stage ({_PRODUCT_COLUMNS}) FROM STDIN WITH (FORMAT csv)",
+                        _product_csv(latest),
+                    )
+                    cur.execute(_PRODUCT_STAGE_MERGE)
+                else:
+                    execute_values(cur, _PRODUCT_UPSERT, [_product_row(p) for p in latest], page_size=500)
+
+                # Source mapping in separate table, encrypted
+                if encrypted:
+                    execute_values(cur, _MAPPING_UPSERT, list(encrypted.items()), page_size=500)
+
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+            finally:
+                cur.close()
+
     # ── Read operations (frontend-safe) ──────────────────────────
 
     def get_product_for_display(self, product_hash: str) -> Optional[dict]:
@@ -257,32 +381,33 @@ class IntelligenceStore:
 
         This is what powers dashboards and public-facing analytics.
         """
-        cur = self.db.cursor()
-        try:
-            cur.execute(
-                """SELECT product_hash, category, name_clean, brand_type,
-                        price_tier, efficacy_signals, ingredient_profile
-                FROM products
-                WHERE product_hash = %s""",
-                (product_hash,),
-            )
+        with self._connection() as db:
+            cur = db.cursor()
+            try:
+                cur.execute(
+                    """SELECT product_hash, category, name_clean, brand_type,
+                            price_tier, efficacy_signals, ingredient_profile
+                    FROM products
+                    WHERE product_hash = %s""",
+                    (product_hash,),
+                )
 
-            row = cur.fetchone()
-            if not row:
-                return None
+                row = cur.fetchone()
+                if not row:
+                    return None
 
-            return {
-                "id": row[0][:8],  # Truncated hash as public ID
-                "category": row[1],
-                "name": row[2],
-                "brand_tier": row[3],
-                "price_tier": row[4],
-                "efficacy": row[5],
-                "ingredients": row[6],
-                # NO source, NO url, NO "available at Sephora"
-            }
-        finally:
-            cur.close()
+                return {
+                    "id": row[0][:8],  # Truncated hash as public ID
+                    "category": row[1],
+                    "name": row[2],
+                    "brand_tier": row[3],
+                    "price_tier": row[4],
+                    "efficacy": row[5],
+                    "ingredients": row[6],
+                    # NO source, NO url, NO "available at Sephora"
+                }
+            finally:
+                cur.close()
 
     def search_products(
         self,
@@ -291,7 +416,12 @@ class IntelligenceStore:
         price_tier: Optional[str] = None,
         limit: int = 50,
     ) -> list[dict]:
-        """Search products by filters -- all results are source-free."""
+        """Search products by filters -- all results are source-free.
+
+        Any combination of filters is served by an index: category-led
+        searches by idx_products_search, the rest by idx_products_brand_search
+        or idx_products_tier_search.
+        """
         conditions = []
         params = []
 
@@ -308,73 +438,117 @@ class IntelligenceStore:
         where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
         params.append(limit)
 
-        cur = self.db.cursor()
-        try:
-            cur.execute(
-                f"""SELECT product_hash, category, name_clean, brand_type,
-                        price_tier, efficacy_signals, ingredient_profile
-                FROM products
-                {where}
-                ORDER BY last_updated DESC
-                LIMIT %s""",
-                params,
-            )
+        with self._connection() as db:
+            cur = db.cursor()
+            try:
+                cur.execute(
+                    f"""SELECT product_hash, category, name_clean, brand_type,
+                            price_tier, efficacy_signals, ingredient_profile
+                    FROM products
+                    {where}
+                    ORDER BY last_updated DESC
+                    LIMIT %s""",
+                    params,
+                )
 
-            return [
-                {
-                    "id": row[0][:8],
-                    "category": row[1],
-                    "name": row[2],
-                    "brand_tier": row[3],
-                    "price_tier": row[4],
-                    "efficacy": row[5],
-                    "ingredients": row[6],
-                }
-                for row in cur.fetchall()
-            ]
-        finally:
-            cur.close()
+                return [
+                    {
+                        "id": row[0][:8],
+                        "category": row[1],
+                        "name": row[2],
+                        "brand_tier": row[3],
+                        "price_tier": row[4],
+                        "efficacy": row[5],
+                        "ingredients": row[6],
+                    }
+                    for row in cur.fetchall()
+                ]
+            finally:
+                cur.close()
+
+    def search_products_by_signal(
+        self,
+        signal: dict,
+        field: str = "efficacy_signals",
+        limit: int = 50,
+    ) -> list[dict]:
+        """Products whose JSONB `field` contains `signal` -- source-free.
+
+        e.g. search_products_by_signal({"actives": ["retinol"]},
+        field="ingredient_profile"). Containment (@>) is served by the
+        field's GIN index.
+        """
+        if field not in _SIGNAL_FIELDS:
+            raise ValueError(f"Invalid field '{field}'. Must be one of {_SIGNAL_FIELDS}")
+
+        with self._connection() as db:
+            cur = db.cursor()
+            try:
+                cur.execute(
+                    f"""SELECT product_hash, category, name_clean, brand_type,
+                            price_tier, efficacy_signals, ingredient_profile
+                    FROM products
+                    WHERE {field} @> %s
+                    ORDER BY last_updated DESC
+                    LIMIT %s""",
+                    (Json(signal), limit),
+                )
+
+                return [
+                    {
+                        "id": row[0][:8],
+                        "category": row[1],
+                        "name": row[2],
+                        "brand_tier": row[3],
+                        "price_tier": row[4],
+                        "efficacy": row[5],
+                        "ingredients": row[6],
+                    }
+                    for row in cur.fetchall()
+                ]
+            finally:
+                cur.close()
 
     def get_market_summary(self) -> dict:
         """Aggregate market intelligence for dashboard display."""
-        cur = self.db.cursor()
-        try:
-            cur.execute(
-                """SELECT
-                    COUNT(*) as total_products,
-                    COUNT(DISTINCT category) as categories,
-                    json_object_agg(
-                        COALESCE(brand_type, 'unknown'),
-                        brand_count
-                    ) as brand_distribution,
-                    json_object_agg(
-                        COALESCE(price_tier, 'unknown'),
-                        price_count
-                    ) as price_distribution
-                FROM (
-                    SELECT brand_type, COUNT(*) as brand_count
-                    FROM products GROUP BY brand_type
-                ) b,
-                (
-                    SELECT price_tier, COUNT(*) as price_count
-                    FROM products GROUP BY price_tier
-                ) p,
-                (SELECT COUNT(*) as total_products, COUNT(DISTINCT category) as categories FROM products) t"""
-            )
-            row = cur.fetchone()
-            if not row:
-                return {"total_products": 0}
-            return {
-                "total_products": row[0],
-                "categories": row[1],
-                "brand_distribution": row[2] or {},
-                "price_distribution": row[3] or {},
-            }
-        except Exception as e:
-            logger.error(f"Market summary query failed: {e}")
-            return {"total_products": 0, "error": str(e)}
-        finally:
-            cur.close()
+        with self._connection() as db:
+            cur = db.cursor()
+            try:
+                # One pass over products: the grouping sets yield the per-brand and
+                # per-tier counts plus the grand total row
+                cur.execute(
+                    """WITH g AS (
+                        SELECT
+                            GROUPING(brand_type) AS no_brand,
+                            GROUPING(price_tier) AS no_tier,
+                            brand_type, price_tier,
+                            COUNT(*) AS c,
+                            COUNT(DISTINCT category) AS cats
+                        FROM products
+                        GROUP BY GROUPING SETS ((brand_type), (price_tier), ())
+                    )
+                    SELECT
+                        (SELECT c FROM g WHERE no_brand = 1 AND no_tier = 1) AS total_products,
+                        (SELECT cats FROM g WHERE no_brand = 1 AND no_tier = 1) AS categories,
+                        (SELECT jsonb_object_agg(COALESCE(brand_type, 'unknown'), c)
+                         FROM g WHERE no_brand = 0) AS brand_distribution,
+                        (SELECT jsonb_object_agg(COALESCE(price_tier, 'unknown'), c)
+                         FROM g WHERE no_tier = 0) AS price_distribution"""
+                )
+                row = cur.fetchone()
+                if not row:
+                    return {"total_products": 0}
+                return {
+                    "total_products": row[0],
+                    "categories": row[1],
+                    "brand_distribution": row[2] or {},
+                    "price_distribution": row[3] or {},
+                }
+            except Exception as e:
+                logger.error(f"Market summary query failed: {e}")
+                return {"total_products": 0, "error": str(e)}
+            finally:
+                cur.close()
 
     # ── Internal-only operations (purchasing team) ───────────────
 
@@ -388,25 +562,26 @@ class IntelligenceStore:
             logger.error("Cannot decrypt: KMS encryption not initialised")
             return None
 
-        cur = self.db.cursor()
-        try:
-            cur.execute(
-                """SELECT encrypted_mapping FROM source_mappings
-                WHERE acquisition_lead = %s""",
-                (acquisition_lead,),
-            )
+        with self._connection() as db:
+            cur = db.cursor()
+            try:
+                cur.execute(
+                    """SELECT encrypted_mapping FROM source_mappings
+                    WHERE acquisition_lead = %s""",
+                    (acquisition_lead,),
+                )
 
-            row = cur.fetchone()
-            if not row:
-                return None
+                row = cur.fetchone()
+                if not row:
+                    return None
 
-            decrypted = self.cipher.decrypt(row[0])
-            return json.loads(decrypted)
-        except Exception as e:
-            logger.error(f"Decryption failed for {acquisition_lead}: {e}")
-            return None
-        finally:
-            cur.close()
+                decrypted = self.cipher.decrypt(row[0])
+                return json.loads(decrypted)
+            except Exception as e:
+                logger.error(f"Decryption failed for {acquisition_lead}: {e}")
+                return None
+            finally:
+                cur.close()
 
     # ── Purchase orders (internal ops) ─────────────────────────
 
@@ -423,27 +598,28 @@ class IntelligenceStore:
         Returns the new order ID.
         """
         margin = ((suggested_retail - cost_price) / suggested_retail) * 100
-        cur = self.db.cursor()
-        try:
-            cur.execute(
-                """INSERT INTO purchase_orders
-                   (acquisition_lead, supplier, cost_price,
-                    suggested_retail, margin_percent, assigned_buyer)
-                   VALUES (%s, %s, %s, %s, %s, %s)
-                   RETURNING id""",
-                (acquisition_lead, supplier, cost_price,
-                 suggested_retail, round(margin, 2), assigned_buyer),
-            )
-            order_id = cur.fetchone()[0]
-            self.db.commit()
-            logger.info(f"Created purchase order #{order_id} for {acquisition_lead}")
-            return order_id
-        except Exception as e:
-            self.db.rollback()
-            logger.error(f"Failed to create purchase order: {e}")
-            raise
-        finally:
-            cur.close()
+        with self._connection() as db:
+            cur = db.cursor()
+            try:
+                cur.execute(
+                    """INSERT INTO purchase_orders
+                       (acquisition_lead, supplier, cost_price,
+                        suggested_retail, margin_percent, assigned_buyer)
+                       VALUES (%s, %s, %s, %s, %s, %s)
+                       RETURNING id""",
+                    (acquisition_lead, supplier, cost_price,
+                     suggested_retail, round(margin, 2), assigned_buyer),
+                )
+                order_id = cur.fetchone()[0]
+                db.commit()
+                logger.info(f"Created purchase order #{order_id} for {acquisition_lead}")
+                return order_id
+            except Exception as e:
+                db.rollback()
+                logger.error(f"Failed to create purchase order: {e}")
+                raise
+            finally:
+                cur.close()
 
     def update_order_status(self, order_id: int, status: str):
         """Update a purchase order status.
@@ -454,43 +630,45 @@ class IntelligenceStore:
         if status not in valid:
             raise ValueError(f"Invalid status '{status}'. Must be one of {valid}")
 
-        cur = self.db.cursor()
-        try:
-            cur.execute(
-                "UPDATE purchase_orders SET status = %s WHERE id = %s",
-                (status, order_id),
-            )
-            self.db.commit()
-        except Exception as e:
-            self.db.rollback()
-            raise
-        finally:
-            cur.close()
+        with self._connection() as db:
+            cur = db.cursor()
+            try:
+                cur.execute(
+                    "UPDATE purchase_orders SET status = %s WHERE id = %s",
+                    (status, order_id),
+                )
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                raise
+            finally:
+                cur.close()
 
     def get_orders_by_status(self, status: str, limit: int = 50) -> list[dict]:
         """Get purchase orders filtered by status."""
-        cur = self.db.cursor()
-        try:
-            cur.execute(
-                """SELECT id, acquisition_lead, supplier, cost_price,
-                          suggested_retail, margin_percent, status,
-                          assigned_buyer, created_at
-                   FROM purchase_orders
-                   WHERE status = %s
-                   ORDER BY created_at DESC LIMIT %s""",
-                (status, limit),
-            )
-            return [
-                {
-                    "id": r[0], "acquisition_lead": r[1], "supplier": r[2],
-                    "cost_price": float(r[3]), "suggested_retail": float(r[4]),
-                    "margin_percent": float(r[5]), "status": r[6],
-                    "assigned_buyer": r[7], "created_at": r[8].isoformat(),
-                }
-                for r in cur.fetchall()
-            ]
-        finally:
-            cur.close()
+        with self._connection() as db:
+            cur = db.cursor()
+            try:
+                cur.execute(
+                    """SELECT id, acquisition_lead, supplier, cost_price,
+                              suggested_retail, margin_percent, status,
+                              assigned_buyer, created_at
+                       FROM purchase_orders
+                       WHERE status = %s
+                       ORDER BY created_at DESC LIMIT %s""",
+                    (status, limit),
+                )
+                return [
+                    {
+                        "id": r[0], "acquisition_lead": r[1], "supplier": r[2],
+                        "cost_price": float(r[3]), "suggested_retail": float(r[4]),
+                        "margin_percent": float(r[5]), "status": r[6],
+                        "assigned_buyer": r[7], "created_at": r[8].isoformat(),
+                    }
+                    for r in cur.fetchall()
+                ]
+            finally:
+                cur.close()
 
     # ── Recommendation tracking ──────────────────────────────────
 
@@ -508,100 +686,104 @@ class IntelligenceStore:
         Call once when recommendations are shown, then update with
         log_recommendation_click / log_recommendation_purchase.
         """
-        cur = self.db.cursor()
-        try:
-            cur.execute(
-                """INSERT INTO recommendation_logs
-                   (user_id, skin_profile_hash, recommended_products,
-                    clicked_product, purchased_product, revenue_generated)
-                   VALUES (%s, %s, %s, %s, %s, %s)
-                   RETURNING id""",
-                (user_id, skin_profile_hash, recommended_hashes,
-                 clicked_hash, purchased_hash, revenue),
-            )
-            rec_id = cur.fetchone()[0]
-            self.db.commit()
-            return rec_id
-        except Exception as e:
-            self.db.rollback()
-            logger.error(f"Failed to log recommendation: {e}")
-            raise
-        finally:
-            cur.close()
+        with self._connection() as db:
+            cur = db.cursor()
+            try:
+                cur.execute(
+                    """INSERT INTO recommendation_logs
+                       (user_id, skin_profile_hash, recommended_products,
+                        clicked_product, purchased_product, revenue_generated)
+                       VALUES (%s, %s, %s, %s, %s, %s)
+                       RETURNING id""",
+                    (user_id, skin_profile_hash, recommended_hashes,
+                     clicked_hash, purchased_hash, revenue),
+                )
+                rec_id = cur.fetchone()[0]
+                db.commit()
+                return rec_id
+            except Exception as e:
+                db.rollback()
+                logger.error(f"Failed to log recommendation: {e}")
+                raise
+            finally:
+                cur.close()
 
     def log_recommendation_click(self, rec_id: int, product_hash: str):
         """Update a recommendation log with the clicked product."""
-        cur = self.db.cursor()
-        try:
-            cur.execute(
-                "UPDATE recommendation_logs SET clicked_product = %s WHERE id = %s",
-                (product_hash, rec_id),
-            )
-            self.db.commit()
-        except Exception as e:
-            self.db.rollback()
-            raise
-        finally:
-            cur.close()
+        with self._connection() as db:
+            cur = db.cursor()
+            try:
+                cur.execute(
+                    "UPDATE recommendation_logs SET clicked_product = %s WHERE id = %s",
+                    (product_hash, rec_id),
+                )
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                raise
+            finally:
+                cur.close()
 
     def log_recommendation_purchase(
         self, rec_id: int, product_hash: str, revenue: float
     ):
         """Update a recommendation log with the purchase outcome."""
-        cur = self.db.cursor()
-        try:
-            cur.execute(
-                """UPDATE recommendation_logs
-                   SET purchased_product = %s, revenue_generated = %s
-                   WHERE id = %s""",
-                (product_hash, revenue, rec_id),
-            )
-            self.db.commit()
-        except Exception as e:
-            self.db.rollback()
-            raise
-        finally:
-            cur.close()
+        with self._connection() as db:
+            cur = db.cursor()
+            try:
+                cur.execute(
+                    """UPDATE recommendation_logs
+                       SET purchased_product = %s, revenue_generated = %s
+                       WHERE id = %s""",
+                    (product_hash, revenue, rec_id),
+                )
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                raise
+            finally:
+                cur.close()
 
     def get_recommendation_stats(self) -> dict:
         """Get aggregate recommendation performance metrics."""
-        cur = self.db.cursor()
-        try:
-            cur.execute(
-                """SELECT
-                    COUNT(*) as total_recs,
-                    COUNT(clicked_product) as total_clicks,
-                    COUNT(purchased_product) as total_purchases,
-                    COALESCE(SUM(revenue_generated), 0) as total_revenue,
-                    ROUND(
-                        COUNT(clicked_product)::numeric / NULLIF(COUNT(*), 0) * 100, 1
-                    ) as ctr_percent,
-                    ROUND(
-                        COUNT(purchased_product)::numeric / NULLIF(COUNT(clicked_product), 0) * 100, 1
-                    ) as conversion_percent
-                FROM recommendation_logs"""
-            )
-            row = cur.fetchone()
-            return {
-                "total_recommendations": row[0],
-                "total_clicks": row[1],
-                "total_purchases": row[2],
-                "total_revenue": float(row[3]),
-                "click_through_rate": float(row[4] or 0),
-                "conversion_rate": float(row[5] or 0),
-            }
-        except Exception as e:
-            logger.error(f"Recommendation stats query failed: {e}")
-            return {"total_recommendations": 0}
-        finally:
-            cur.close()
+        with self._connection() as db:
+            cur = db.cursor()
+            try:
+                cur.execute(
+                    """SELECT
+                        COUNT(*) as total_recs,
+                        COUNT(clicked_product) as total_clicks,
+                        COUNT(purchased_product) as total_purchases,
+                        COALESCE(SUM(revenue_generated), 0) as total_revenue,
+                        ROUND(
+                            COUNT(clicked_product)::numeric / NULLIF(COUNT(*), 0) * 100, 1
+                        ) as ctr_percent,
+                        ROUND(
+                            COUNT(purchased_product)::numeric / NULLIF(COUNT(clicked_product), 0) * 100, 1
+                        ) as conversion_percent
+                    FROM recommendation_logs"""
+                )
+                row = cur.fetchone()
+                return {
+                    "total_recommendations": row[0],
+                    "total_clicks": row[1],
+                    "total_purchases": row[2],
+                    "total_revenue": float(row[3]),
+                    "click_through_rate": float(row[4] or 0),
+                    "conversion_rate": float(row[5] or 0),
+                }
+            except Exception as e:
+                logger.error(f"Recommendation stats query failed: {e}")
+                return {"total_recommendations": 0}
+            finally:
+                cur.close()
 
     # ── Lifecycle ────────────────────────────────────────────────
 
     def close(self):
-        """Close the database connection."""
-        if self.db:
-            self.db.close()
+        """Close every pooled database connection."""
+        if not self._pool.closed:
+            self._pool.closeall()
 
     def __enter__(self):
         return self
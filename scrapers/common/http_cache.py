@@ -0,0 +1,62 @@
+"""On-disk HTTP validator cache for conditional re-fetches (SQLite)."""
+
+import os
+import sqlite3
+import time
+import zlib
+from typing import Optional
+
+
+class HttpCache:
+    """Last 200 body per URL, with the ETag / Last-Modified it came with.
+
+    Lets re-runs send If-None-Match / If-Modified-Since and reuse the stored
+    body on a 304 instead of transferring the page again. Bodies are stored
+    zlib-compressed.
+    """
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, "
+            "body BLOB NOT NULL, fetched_at REAL NOT NULL)"
+        )
+
+    def conditional_headers(self, url: str) -> dict:
+        """Validator headers for re-fetching `url`; empty if nothing is cached."""
+        row = self._conn.execute(
+            "SELECT etag, last_modified FROM responses WHERE url = ?", (url,)
+        ).fetchone()
+        if row is None:
+            return {}
+        etag, last_modified = row
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def body(self, url: str) -> Optional[str]:
+        """Stored body for `url` (after a 304), or None."""
+        row = self._conn.execute("SELECT body FROM responses WHERE url = ?", (url,)).fetchone()
+        return zlib.decompress(row[0]).decode("utf-8") if row else None
+
+    def put(self, url: str, etag: Optional[str], last_modified: Optional[str], body: str):
+        """Store a 200 response; ignored if it carries no validator."""
+        if not etag and not last_modified:
+            return
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO responses (url, etag, last_modified, body, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (url) DO UPDATE SET etag = excluded.etag, "
+                "last_modified = excluded.last_modified, body = excluded.body, "
+                "fetched_at = excluded.fetched_at",
+                (url, etag, last_modified, zlib.compress(body.encode("utf-8")), time.time()),
+            )
+
+    def close(self):
+        self._conn.close()
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import random
+import re
 from typing import Optional
 
 from proxy_rotation.manager import StealthProxyManager
@@ -136,6 +137,25 @@ class StealthBrowser:
         }
     """
 
+    # Page-side scroll step, installed once per context so each scroll is a
+    # tiny evaluate() call instead of re-sending the function body.
+    HUMAN_SCROLL_SCRIPT = """
+        window.__humanScroll = async (steps = 1) => {
+            for (let i = 0; i < steps; i++) {
+                window.scrollBy(0, window.innerHeight * (0.3 + Math.random() * 0.5));
+                await new Promise(r => setTimeout(r, 800 + Math.random() * 1700));
+            }
+        };
+    """
+
+    # Images, fonts and media are never read by the parsers. Matching by URL
+    # means only these requests are intercepted; everything else goes
+    # straight to the network without a round trip through Python.
+    BLOCKED_ASSETS = re.compile(
+        r"\.(?:png|jpe?g|gif|webp|avif|svg|ico|bmp|woff2?|ttf|otf|eot|mp4|webm|mp3|m4a)(?:[?#]|$)",
+        re.IGNORECASE,
+    )
+
     def __init__(self, proxy_manager: StealthProxyManager):
         self.proxy_manager = proxy_manager
         self._playwright = None
@@ -227,6 +247,8 @@ class StealthBrowser:
         )
 
         context.add_init_script(self.STEALTH_SCRIPT)
+        context.add_init_script(self.HUMAN_SCROLL_SCRIPT)
+        context.route(self.BLOCKED_ASSETS, lambda route: route.abort())
         page = context.new_page()
 
         # Realistic mouse movement simulation
@@ -293,6 +315,11 @@ class StealthBrowserAsync:
         return browser
 
     async def new_page(self, browser):
+        """Open a page in a fresh context of its own."""
+        return await self.open_page(await self.new_context(browser))
+
+    async def new_context(self, browser):
+        """Create an isolated context with a randomised fingerprint."""
         width = random.randint(1200, 1920)
         height = random.randint(800, 1080)
 
@@ -314,7 +341,13 @@ class StealthBrowserAsync:
             },
         )
 
-        context.add_init_script(StealthBrowser.STEALTH_SCRIPT)
+        await context.add_init_script(StealthBrowser.STEALTH_SCRIPT)
+        await context.add_init_script(StealthBrowser.HUMAN_SCROLL_SCRIPT)
+        await context.route(StealthBrowser.BLOCKED_ASSETS, _abort_route)
+        return context
+
+    async def open_page(self, context):
+        """Open a page in an existing context, with mouse-movement noise."""
         page = await context.new_page()
 
         await page.evaluate(
@@ -336,3 +369,7 @@ class StealthBrowserAsync:
         )
 
         return page
+
+
+async def _abort_route(route):
+    await route.abort()
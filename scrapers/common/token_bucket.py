@@ -0,0 +1,32 @@
+"""Async token-bucket rate limiter for per-host request pacing."""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Allows bursts of up to `capacity` requests, averaging `rate` per second.
+
+    Tokens refill continuously; each acquire() takes `cost` tokens, sleeping
+    until enough have accumulated. Waiters are served in arrival order.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    async def acquire(self, cost: float = 1):
+        async with self._lock:
+            self._refill()
+            if self._tokens < cost:
+                await asyncio.sleep((cost - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= cost
@@ -25,8 +25,9 @@ import logging
 import os
 import re
 import sys
+import time
 from dataclasses import asdict
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 from urllib.parse import urljoin, urlparse, parse_qs
 
@@ -35,7 +36,7 @@ from bs4 import BeautifulSoup
 # Ensure project root is on path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
-from scrapers.common.base import BaseScraper
+from scrapers.common.base import BaseScraper, run_async
 from scrapers.common.models import Product, PricePoint, ScraperResult, Source, Category
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
@@ -707,7 +708,8 @@ class SephoraScraper(BaseScraper):
 
     async def scrape(self) -> ScraperResult:
         """Run the scrape with API-first strategy and browser fallback."""
-        started_at = datetime.utcnow()
+        started_at = datetime.now(timezone.utc)
+        started = time.monotonic()
         products: list[Product] = []
         errors: list[str] = []
         total_pages = 0
@@ -794,7 +796,7 @@ class SephoraScraper(BaseScraper):
                 unique_products.append(p)
         products = unique_products
 
-        finished_at = datetime.utcnow()
+        finished_at = started_at + timedelta(seconds=time.monotonic() - started)
         result = ScraperResult(
             source=self.source,
             products=products,
@@ -1045,7 +1047,7 @@ def main():
     parser.add_argument("--category", default=None, help="Single category key to scrape")
     args = parser.parse_args()
 
-    asyncio.run(run(args.pages, args.output, args.category))
+    run_async(run(args.pages, args.output, args.category))
 
 
 if __name__ == "__main__":
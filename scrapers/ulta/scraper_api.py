@@ -20,7 +20,8 @@ import logging
 import os
 import re
 import sys
-from datetime import datetime
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 from urllib.parse import urljoin, urlparse
 
@@ -28,7 +29,7 @@ from bs4 import BeautifulSoup
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
-from scrapers.common.base import BaseScraper
+from scrapers.common.base import BaseScraper, run_async
 from scrapers.common.models import Product, PricePoint, ScraperResult, Source, Category
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
@@ -96,10 +97,10 @@ class UltaScraper(BaseScraper):
 
     async def scrape(self):
         """Override base scrape to use Playwright for Ulta (anti-bot protection)."""
-        from datetime import datetime
         from scrapers.common.models import ScraperResult
 
-        started_at = datetime.utcnow()
+        started_at = datetime.now(timezone.utc)
+        started = time.monotonic()
         products = []
         errors = []
         total_pages = 0
@@ -108,6 +109,7 @@ class UltaScraper(BaseScraper):
 
         category_urls = await self.get_category_urls()
         product_urls = []
+        seen_urls = set()  # Dedupe as URLs arrive, keeping first-seen order
 
         # Phase 1: Collect product URLs from listing pages using Playwright
         for cat_url in category_urls:
@@ -120,12 +122,13 @@ class UltaScraper(BaseScraper):
                 total_pages += 1
                 try:
                     urls = await self.parse_listing(html, cat_url)
-                    product_urls.extend(urls)
+                    for u in urls:
+                        if u not in seen_urls:
+                            seen_urls.add(u)
+                            product_urls.append(u)
                 except Exception as e:
                     errors.append(f"Listing parse error ({cat_url}): {e}")
 
-        # Deduplicate
-        product_urls = list(set(product_urls))
         logger.info(f"[{self.source.value}] Found {len(product_urls)} product URLs")
 
         # Phase 2: Scrape individual product pages using Playwright
@@ -144,7 +147,7 @@ class UltaScraper(BaseScraper):
                 except Exception as e:
                     errors.append(f"Product parse error ({url}): {e}")
 
-        finished_at = datetime.utcnow()
+        finished_at = started_at + timedelta(seconds=time.monotonic() - started)
         result = ScraperResult(
             source=self.source,
             products=products,
@@ -541,7 +544,7 @@ def main():
     parser.add_argument("--category", default=None, help="Single category key to scrape")
     args = parser.parse_args()
 
-    asyncio.run(run(args.pages, args.output, args.category))
+    run_async(run(args.pages, args.output, args.category))
 
 
 if __name__ == "__main__":
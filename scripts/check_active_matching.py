@@ -0,0 +1,96 @@
+"""
+Check that the catalog promoter's SQL active matching agrees with the
+per-keyword `in` loop it replaced, including names whose keywords overlap
+("vitamin ceramide", "vitamin centella").
+Run: DATABASE_URL=postgres://... python scripts/check_active_matching.py
+
+Nothing is written: the active_map temp table is rolled back at the end.
+"""
+
+import importlib.util
+import os
+import sys
+
+import psycopg2
+
+# The handler reads these at import; the check never touches AWS
+os.environ.setdefault("DB_SECRET_ARN", "unused")
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+HANDLER = os.path.join(
+    os.path.dirname(__file__), "..", "deployment", "catalog_promoter", "handler.py"
+)
+
+NAMES = [
+    "vitamin ceramide cream",
+    "vitamin centella serum",
+    "Vitamin C + Ceramide Barrier Moisturizer",
+    "retinol retinal night oil",
+    "salicylic acid and glycolic acid toner",
+    "snail mucin 96% power essence with panthenol",
+    "niacinamide 10% + zinc 1%",
+    "tea tree ceramide propolis balm",
+    "hydrating cleanser",
+    "",
+]
+
+
+def load_handler():
+    spec = importlib.util.spec_from_file_location("catalog_promoter", HANDLER)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def python_matches(handler, name: str) -> list:
+    """The original loop: every keyword tested with `in`, in active_map order."""
+    return [
+        active for _, active, *_ in handler._ACTIVE_MAP_ROWS
+        if active in name
+    ]
+
+
+def sql_matches(handler, cur) -> dict:
+    handler._load_active_map(cur)
+    cur.execute(
+        f"""
+        WITH candidates AS (
+            SELECT * FROM unnest(%(hashes)s::text[], %(names)s::text[])
+                AS c(product_hash, name_lower)
+        ),
+        matched AS ({handler._MATCH_ACTIVES})
+        SELECT product_hash, array_agg(active ORDER BY ord)
+        FROM matched GROUP BY product_hash
+        """,
+        {
+            "hashes": [str(i) for i in range(len(NAMES))],
+            "names": [name.lower() for name in NAMES],
+            "active_re": handler._ACTIVE_PATTERN,
+        },
+    )
+    return dict(cur.fetchall())
+
+
+def main() -> int:
+    handler = load_handler()
+    conn = psycopg2.connect(os.environ["DATABASE_URL"])
+    try:
+        got = sql_matches(handler, conn.cursor())
+    finally:
+        conn.rollback()
+        conn.close()
+
+    failures = 0
+    for i, name in enumerate(NAMES):
+        expected = python_matches(handler, name.lower())
+        actual = got.get(str(i), [])
+        status = "OK  " if actual == expected else "FAIL"
+        failures += actual != expected
+        print(f"{status} {name!r}: sql={actual} python={expected}")
+
+    print(f"\n{len(NAMES) - failures}/{len(NAMES)} names match")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())